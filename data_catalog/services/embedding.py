@@ -87,14 +87,15 @@ class EmbeddingService:
     @staticmethod
     def binarize_single(vector) -> str:
         """Binarize a single vector to a bitstring."""
-        return "".join("1" if v > 0 else "0" for v in vector)
+        return np.where(np.asarray(vector) > 0, ord("1"), ord("0")).astype(np.uint8).tobytes().decode("ascii")
 
     def binarize(self, embeddings: np.ndarray) -> list[str]:
         """Convert float embeddings to compact bitstrings."""
         if embeddings.size == 0:
             return []
-        binary = embeddings > 0
-        return ["".join("1" if b else "0" for b in row) for row in binary]
+        # One vectorised '0'/'1' byte matrix, decoded row by row.
+        chars = np.where(embeddings > 0, ord("1"), ord("0")).astype(np.uint8)
+        return [row.tobytes().decode("ascii") for row in chars]
 
     def embed_query(self, text: str) -> np.ndarray:
         """Embed a single query string."""
@@ -33,9 +33,21 @@ class GraphMetricsService:
 
     def __init__(self, db: Session) -> None:
         self.db = db
+        self._graph: nx.DiGraph | None = None
+        # (graph, nodelist, CSR adjacency) for the last graph seen by
+        # _adjacency(), so repeated metrics on one graph convert it once.
+        self._csr_cache: tuple[nx.DiGraph, list[str], Any] | None = None
+
+    def build_graph(self, refresh: bool = False) -> nx.DiGraph:
+        """Build a directed graph from validated FK relationships.
+
+        The graph is built once per service instance and reused by later
+        calls (including analyze()); pass ``refresh=True`` to rebuild it
+        after the catalog has changed.
+        """
+        if self._graph is not None and not refresh:
+            return self._graph
 
-    def build_graph(self) -> nx.DiGraph:
-        """Build a directed graph from validated FK relationships."""
         G = nx.DiGraph()
 
         assets = self.db.query(Asset).all()
@@ -60,13 +72,63 @@ class GraphMetricsService:
             )
 
         logger.info(f"Built graph: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+        self._graph = G
         return G
 
-    def compute_pagerank(self, G: nx.DiGraph) -> dict[str, float]:
-        """Compute PageRank centrality for all nodes."""
+    def _adjacency(self, G: nx.DiGraph) -> tuple[list[str], Any]:
+        """Return ``(nodelist, A)`` with ``A`` the CSR adjacency matrix of G.
+
+        Built directly from the edge list (no NetworkX conversion) and cached
+        per graph object; graphs are not mutated after build_graph().
+        """
+        if self._csr_cache is not None and self._csr_cache[0] is G:
+            return self._csr_cache[1], self._csr_cache[2]
+
+        import scipy.sparse as sp
+
+        nodelist = list(G)
+        index = {node: i for i, node in enumerate(nodelist)}
+        n = len(nodelist)
+        rows = np.fromiter((index[u] for u, _ in G.edges), dtype=np.int64, count=G.number_of_edges())
+        cols = np.fromiter((index[v] for _, v in G.edges), dtype=np.int64, count=G.number_of_edges())
+        A = sp.csr_array((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+
+        self._csr_cache = (G, nodelist, A)
+        return nodelist, A
+
+    def compute_pagerank(
+        self,
+        G: nx.DiGraph,
+        alpha: float = 0.85,
+        max_iter: int = 100,
+        tol: float = 1.0e-6,
+    ) -> dict[str, float]:
+        """Compute PageRank centrality for all nodes.
+
+        Power iteration on the CSR adjacency matrix, with the same defaults
+        and dangling-node handling as ``nx.pagerank``.
+        """
         if G.number_of_nodes() == 0:
             return {}
-        return nx.pagerank(G)
+
+        import scipy.sparse as sp
+
+        nodelist, A = self._adjacency(G)
+        n = len(nodelist)
+
+        out_degree = A.sum(axis=1)
+        dangling = out_degree == 0
+        inv_out = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+        P = sp.diags_array(inv_out) @ A  # row-stochastic transition matrix
+
+        p = np.full(n, 1.0 / n)
+        x = p.copy()
+        for _ in range(max_iter):
+            x_last = x
+            x = alpha * (x @ P + x[dangling].sum() * p) + (1 - alpha) * p
+            if np.abs(x - x_last).sum() < n * tol:
+                return dict(zip(nodelist, map(float, x), strict=True))
+        raise nx.PowerIterationFailedConvergence(max_iter)
 
     def detect_communities(self, G: nx.DiGraph) -> dict[str, int]:
         """Detect communities using Louvain algorithm on undirected
@@ -14,6 +14,7 @@ from release_lib.semver import (
     analyze_changes,
     bump_version,
     calculate_semantic_version,
+    get_changed_file_status,
     get_changed_files,
     get_last_tag,
     next_version_from_tag,
@@ -33,6 +34,7 @@ __all__ = [
     "analyze_changes",
     "bump_version",
     "calculate_semantic_version",
+    "get_changed_file_status",
     "get_changed_files",
     "get_last_tag",
     "next_version_from_tag",
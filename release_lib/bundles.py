@@ -172,6 +172,7 @@ BUNDLE_DEFINITIONS: dict[str, dict] = {
             "data_catalog/cli.py",
             "tests/__init__.py",
             "tests/conftest.py",
+            "tests/_factory.py",
             "tests/test_models.py",
             "tests/test_grain_discovery.py",
             "tests/test_fk_discovery.py",
@@ -17,6 +17,13 @@ import subprocess
 import sys
 from pathlib import Path
 
+# Leading vX.Y.Z (or X.Y.Z); anything after the patch number is ignored.
+_VERSION_RE = re.compile(r"v?(\d+)\.(\d+)\.(\d+)")
+
+# analyze_changes(): top-level directories and files whose changes are patches.
+_PATCH_DIRS = frozenset({"tests", "docs", "resources"})
+_PATCH_FILES = frozenset({"pyproject.toml", "requirements.txt", "uv.lock"})
+
 
 def get_changed_files(base_branch):
     """Get list of changed files compared to base.
@@ -32,10 +39,42 @@ def get_changed_files(base_branch):
         return []
 
 
-def analyze_changes(changed_files):
+def get_changed_file_status(base_branch):
+    """Map each file changed since the merge-base with base_branch to its status.
+
+    One ``git diff --name-status -z`` call yields both the paths (as in
+    get_changed_files()) and whether each was added (A), modified (M),
+    deleted (D), renamed (R), etc. Renames and copies are keyed by their
+    new path, matching ``--name-only``. Returns {} on git failure.
+    """
+    try:
+        result = subprocess.check_output(["git", "diff", "--name-status", "-z", f"{base_branch}...HEAD"], text=True)
+    except subprocess.CalledProcessError:
+        return {}
+
+    # NUL-separated: STATUS, PATH for most entries; STATUS, OLD, NEW for R/C.
+    fields = result.split("\0")
+    changes = {}
+    i = 0
+    while i < len(fields) - 1:
+        status = fields[i][:1]
+        if status in ("R", "C"):
+            changes[fields[i + 2]] = status
+            i += 3
+        else:
+            changes[fields[i + 1]] = status
+            i += 2
+    return changes
+
+
+def analyze_changes(changed_files, existing_files=None):
     """
     Determine version bump type based on changed files.
 
+    existing_files, when given, is the set of changed files that still exist
+    at HEAD (see get_changed_file_status()); otherwise the working tree is
+    checked with Path.exists().
+
     Returns:
         'major' | 'minor' | 'patch'
 
@@ -48,24 +87,32 @@ def analyze_changes(changed_files):
     has_feature = False
     has_fix = False
 
-    for file in changed_files:
-        # API changes are potentially breaking
-        if file.startswith("src/api/") or file.startswith("src/*/api/"):
-            # Check if file existed before (new = feature, modified = potentially breaking)
-            if Path(file).exists():
-                has_breaking = True
-
-        # New Python files in src/ are features
-        elif file.startswith("src/") and file.endswith(".py"):
-            if Path(file).exists():
-                has_feature = True
-
-        # Tests, docs, config are patches
-        elif any(file.startswith(prefix) for prefix in ["tests/", "docs/", "resources/"]):
-            has_fix = True
+    exists = existing_files.__contains__ if existing_files is not None else (lambda f: Path(f).exists())
 
-        # Configuration changes
-        elif file in ["pyproject.toml", "requirements.txt", "uv.lock"]:
+    for file in changed_files:
+        # Dispatch on the first path segment rather than testing every prefix.
+        top, sep, rest = file.partition("/")
+
+        # Configuration changes (top-level files only)
+        if not sep:
+            if file in _PATCH_FILES:
+                has_fix = True
+
+        elif top == "src":
+            # API changes are potentially breaking
+            if rest.startswith(("api/", "*/api/")):
+                # Check if file existed before (new = feature, modified = potentially breaking)
+                if exists(file):
+                    has_breaking = True
+                    break  # major wins; the remaining files cannot change it
+
+            # New Python files in src/ are features
+            elif file.endswith(".py"):
+                if exists(file):
+                    has_feature = True
+
+        # Tests, docs, resources are patches
+        elif top in _PATCH_DIRS:
             has_fix = True
 
     # Determine bump type (priority: major > minor > patch)
@@ -82,7 +129,7 @@ def analyze_changes(changed_files):
 def bump_version(current_version, bump_type):
     """Increment version based on bump type."""
     # Parse version (handle vX.Y.Z or X.Y.Z format)
-    match = re.match(r"v?(\d+)\.(\d+)\.(\d+)", current_version)
+    match = _VERSION_RE.match(current_version)
     if not match:
         print(f"Warning: Invalid version format '{current_version}', defaulting to v1.0.0")
         return "v1.0.0"
@@ -122,13 +169,15 @@ def get_last_tag(ref=None):
 
 def calculate_semantic_version(base_branch, current_version):
     """Calculate next semantic version based on changes."""
-    changed_files = get_changed_files(base_branch)
+    changes = get_changed_file_status(base_branch)
 
-    if not changed_files:
+    if not changes:
         print("No changed files detected")
         return current_version
 
-    bump_type = analyze_changes(changed_files)
+    changed_files = list(changes)
+    existing_files = {path for path, status in changes.items() if status != "D"}
+    bump_type = analyze_changes(changed_files, existing_files)
     new_version = bump_version(current_version, bump_type)
 
     print(f"Changed files: {len(changed_files)}", file=sys.stderr)
@@ -13,6 +13,10 @@ Constants:
   Rationale: Centralise for easier testing/mocking
 - GITHUB_GRAPHQL_TEMPLATE: GraphQL query for PR review threads
   Rationale: GitHub requires GraphQL for isResolved status (not in REST API)
+- _authenticated_providers: Providers check_auth() has seen authenticated
+  Rationale: ``gh auth status`` / ``az account show`` take hundreds of ms
+- _cached_github_remote: (owner, repo) parsed from remote.origin.url
+  Rationale: Avoid a ``git config`` subprocess per review-thread query
 """
 
 import json
@@ -20,6 +24,13 @@ import subprocess
 
 from .provider import VCSProvider, detect_provider
 
+# Providers that passed check_auth() in this process. Failures are not
+# recorded, so logging in mid-run is picked up on the next check.
+_authenticated_providers: set[VCSProvider] = set()
+
+# Module-level cache for the parsed GitHub remote
+_cached_github_remote: tuple[str, str] | None = None
+
 # CLI command names
 GITHUB_CLI = "gh"
 AZURE_CLI = "az"
@@ -333,7 +344,7 @@ def query_pr_review_threads(pr_number: int, *, provider: VCSProvider | None = No
 
 
 def _parse_github_remote() -> tuple[str, str]:
-    """Parse owner/repo from git remote URL.
+    """Parse owner/repo from git remote URL, cached for the process.
 
     Returns:
         (owner, repo) tuple.
@@ -341,6 +352,10 @@ def _parse_github_remote() -> tuple[str, str]:
     Raises:
         RuntimeError: If parsing fails.
     """
+    global _cached_github_remote
+    if _cached_github_remote is not None:
+        return _cached_github_remote
+
     try:
         remote_url = subprocess.check_output(
             ["git", "config", "--get", "remote.origin.url"],
@@ -350,6 +365,19 @@ def _parse_github_remote() -> tuple[str, str]:
     except (subprocess.CalledProcessError, FileNotFoundError) as e:
         raise RuntimeError(f"Failed to read git remote URL: {e}") from e
 
+    _cached_github_remote = _parse_remote_url(remote_url)
+    return _cached_github_remote
+
+
+def _parse_remote_url(remote_url: str) -> tuple[str, str]:
+    """Parse owner/repo from a GitHub HTTPS or SSH remote URL.
+
+    Returns:
+        (owner, repo) tuple.
+
+    Raises:
+        RuntimeError: If the URL format is unsupported or lacks owner/repo.
+    """
     if remote_url.startswith("https://"):
         parts = remote_url.replace("https://github.com/", "").replace(".git", "").split("/")
     elif remote_url.startswith("git@"):
@@ -475,6 +503,9 @@ def _query_azure_review_threads(pr_number: int) -> list[dict]:
 def check_auth(*, provider: VCSProvider | None = None) -> bool:
     """Check if the user is authenticated with the VCS provider.
 
+    A successful check is cached for the rest of the process; a failed
+    one is re-run on the next call.
+
     Args:
         provider: Explicit provider; auto-detected if None.
 
@@ -483,6 +514,8 @@ def check_auth(*, provider: VCSProvider | None = None) -> bool:
     """
     if provider is None:
         provider = detect_provider()
+    if provider in _authenticated_providers:
+        return True
 
     try:
         if provider == VCSProvider.GITHUB:
@@ -494,4 +527,5 @@ def check_auth(*, provider: VCSProvider | None = None) -> bool:
     except RuntimeError:
         return False
 
+    _authenticated_providers.add(provider)
     return True
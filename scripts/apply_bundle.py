@@ -31,8 +31,8 @@ from release_lib.bundles import (  # noqa: E402
 )
 
 
-def main() -> int:
-    """Entry point."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (importable so tests can skip a subprocess)."""
     parser = argparse.ArgumentParser(
         description="Apply named bundles of files from stharrold-templates to a target repo.",
         epilog="Example: python scripts/apply_bundle.py . ../my-project --bundle git --bundle secrets",
@@ -49,8 +49,12 @@ def main() -> int:
     )
     parser.add_argument("--force", action="store_true", help="Overwrite files that would normally be skipped (e.g. skip_on_update entries)")
     parser.add_argument("--dry-run", action="store_true", help="Print what would change, make no modifications")
+    return parser
+
 
-    args = parser.parse_args()
+def main() -> int:
+    """Entry point."""
+    args = build_parser().parse_args()
 
     source = args.source_repo.resolve()
     target = args.target_repo.resolve()
@@ -11,25 +11,27 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+# Environment variables whose presence marks a CI run.
+CI_VARS = (
+    "CI",
+    "GITHUB_ACTIONS",
+    "GITLAB_CI",
+    "TF_BUILD",  # Azure DevOps
+    "JENKINS_URL",
+    "CIRCLECI",
+    "TRAVIS",
+    "BUILDKITE",
+    "DRONE",
+    "CODEBUILD_BUILD_ID",  # AWS CodeBuild
+)
+
 
 def is_ci() -> bool:
     """Detect if running in a CI environment.
 
-    Checks for common CI environment variables.
+    Checks for the common CI environment variables in ``CI_VARS``.
     """
-    ci_vars = [
-        "CI",
-        "GITHUB_ACTIONS",
-        "GITLAB_CI",
-        "TF_BUILD",  # Azure DevOps
-        "JENKINS_URL",
-        "CIRCLECI",
-        "TRAVIS",
-        "BUILDKITE",
-        "DRONE",
-        "CODEBUILD_BUILD_ID",  # AWS CodeBuild
-    ]
-    return any(os.environ.get(var) for var in ci_vars)
+    return any(os.environ.get(var) for var in CI_VARS)
 
 
 def is_container() -> bool:
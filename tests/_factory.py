@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2025 stharrold
+# SPDX-License-Identifier: Apache-2.0
+"""Shared row builders for the data catalog test suite."""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+
+def new_id() -> str:
+    """Return a random 32-char hex primary key.
+
+    Cheaper than ``str(uuid4())`` (no UUID object, no dash formatting) and
+    fits the ``String(36)`` id columns.
+    """
+    return os.urandom(16).hex()
+
+
+def asset_row(schema: str = "dbo", name: str = "Test", **fields: Any) -> dict[str, Any]:
+    """Return an ``Asset`` row dict for ``[schema].[name]``.
+
+    Usable with ``bulk_insert_mappings`` or unpacked into ``Asset(**...)``;
+    ``fields`` add to or override the defaults.
+    """
+    return {
+        "id": new_id(),
+        "qualified_name": f"[{schema}].[{name}]",
+        "table_schema": schema,
+        "table_name": name,
+        "asset_type": "table",
+        "source_system": "test",
+        **fields,
+    }
+
+
+def relationship_row(parent_asset_id: str, referenced_asset_id: str, **fields: Any) -> dict[str, Any]:
+    """Return a foreign-key ``Relationship`` row dict between two assets."""
+    return {
+        "id": new_id(),
+        "parent_asset_id": parent_asset_id,
+        "referenced_asset_id": referenced_asset_id,
+        "relationship_type": "foreign_key",
+        **fields,
+    }
@@ -6,15 +6,23 @@ from __future__ import annotations
 
 import pytest
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from data_catalog.db.models import Base
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def db_engine():
-    """Create an in-memory DuckDB engine with all tables."""
-    engine = create_engine("duckdb:///:memory:")
+    """Create one in-memory DuckDB engine with all tables per test session.
+
+    ``StaticPool`` pins the engine to a single DBAPI connection, so the
+    in-memory database (extensions, macros, schema) is built once and
+    shared by every test instead of being recreated per test. Under
+    pytest-xdist each worker process builds its own engine, so DB tests
+    parallelise without sharing state.
+    """
+    engine = create_engine("duckdb:///:memory:", poolclass=StaticPool)
 
     with engine.connect() as conn:
         # Install and load extensions. duckdb-engine / SQLAlchemy text()
@@ -37,10 +45,34 @@ def db_engine():
     engine.dispose()
 
 
-@pytest.fixture()
-def db(db_engine) -> Session:
-    """Create a fresh database session for each test."""
-    session_factory = sessionmaker(bind=db_engine)
-    session = session_factory()
+def _rollback_session(engine):
+    """Yield a session bound to an outer transaction that is rolled back.
+
+    The session joins the transaction in ``rollback_only`` mode: a test's
+    ``db.commit()`` flushes its rows without ending that transaction, and
+    teardown rolls everything back so later tests see empty tables.
+    DuckDB has no SAVEPOINT support, which rules out ``create_savepoint``.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="rollback_only")
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture()
+def db(db_engine) -> Session:
+    """Create a database session for each test, rolled back on teardown."""
+    yield from _rollback_session(db_engine)
+
+
+@pytest.fixture(scope="class")
+def class_db(db_engine) -> Session:
+    """Create a database session shared by one test class.
+
+    For read-only tests that seed once per class. The engine has a single
+    connection, so a class using this must not also request ``db``.
+    """
+    yield from _rollback_session(db_engine)
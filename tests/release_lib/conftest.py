@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: 2025 stharrold
+# SPDX-License-Identifier: Apache-2.0
+"""Shared fixtures for the release_lib tests."""
+
+import subprocess
+from unittest.mock import Mock
+
+import pytest
+
+from release_lib.vcs import provider as provider_module
+
+
+@pytest.fixture()
+def _clear_provider_cache(monkeypatch):
+    """Start the test with no cached VCS provider; monkeypatch restores it after.
+
+    Only tests that call detect_provider() need this; the vcs.operations
+    tests pass ``provider=`` explicitly and never consult the cache.
+    """
+    monkeypatch.setattr(provider_module, "_cached_provider", None)
+
+
+@pytest.fixture()
+def mock_check_output(monkeypatch):
+    """Replace ``subprocess.check_output`` with a plain ``Mock`` for one test.
+
+    vcs.provider and vcs.operations both call it through the ``subprocess``
+    module, so this one patch covers git remote lookups and ``_run``.
+    """
+    check_output = Mock()
+    monkeypatch.setattr(subprocess, "check_output", check_output)
+    return check_output
@@ -11,6 +11,7 @@ from release_lib.semver import (
     analyze_changes,
     bump_version,
     calculate_semantic_version,
+    get_changed_file_status,
     get_changed_files,
     get_last_tag,
     next_version_from_tag,
@@ -60,6 +61,31 @@ class TestGetChangedFiles:
         assert "develop...HEAD" in call_args
 
 
+class TestGetChangedFileStatus:
+    """Tests for get_changed_file_status function."""
+
+    @patch("release_lib.semver.subprocess.check_output")
+    def test_maps_paths_to_status(self, mock_output):
+        """Should key renames and copies by their new path."""
+        mock_output.return_value = "M\0src/main.py\0D\0src/api/old.py\0R100\0src/a.py\0src/b.py\0C75\0x.py\0y.py\0A\0tests/t.py\0"
+        assert get_changed_file_status("develop") == {"src/main.py": "M", "src/api/old.py": "D", "src/b.py": "R", "y.py": "C", "tests/t.py": "A"}
+        assert mock_output.call_args[0][0] == ["git", "diff", "--name-status", "-z", "develop...HEAD"]
+
+    @patch("release_lib.semver.subprocess.check_output")
+    def test_empty_diff(self, mock_output):
+        """Should return an empty mapping when nothing changed."""
+        mock_output.return_value = ""
+        assert get_changed_file_status("develop") == {}
+
+    @patch("release_lib.semver.subprocess.check_output")
+    def test_returns_empty_on_git_error(self, mock_output):
+        """Should return an empty mapping on subprocess error."""
+        from subprocess import CalledProcessError
+
+        mock_output.side_effect = CalledProcessError(128, "git")
+        assert get_changed_file_status("develop") == {}
+
+
 class TestAnalyzeChanges:
     """Tests for analyze_changes function."""
 
@@ -117,6 +143,19 @@ class TestAnalyzeChanges:
             )
         assert result == "major"
 
+    def test_existing_files_decide_existence(self):
+        """Should look files up in existing_files instead of the working tree."""
+        with patch.object(Path, "exists") as mock_exists:
+            assert analyze_changes(["src/api/removed.py", "src/new.py"], existing_files={"src/new.py"}) == "minor"
+        mock_exists.assert_not_called()
+
+    def test_stops_scanning_after_breaking_change(self):
+        """Should not stat files listed after a breaking change."""
+        with patch.object(Path, "exists", return_value=True) as mock_exists:
+            result = analyze_changes(["src/api/breaking.py", "src/new_feature.py", "src/other.py"])
+        assert result == "major"
+        assert mock_exists.call_count == 1
+
     def test_minor_takes_priority_over_patch(self):
         """Minor should take priority over patch."""
         with patch.object(Path, "exists", return_value=True):
@@ -178,24 +217,24 @@ class TestCalculateSemanticVersion:
 
     @patch("release_lib.semver.bump_version")
     @patch("release_lib.semver.analyze_changes")
-    @patch("release_lib.semver.get_changed_files")
-    def test_full_calculation_flow(self, mock_files, mock_analyze, mock_bump):
+    @patch("release_lib.semver.get_changed_file_status")
+    def test_full_calculation_flow(self, mock_changes, mock_analyze, mock_bump):
         """Should calculate version through full flow."""
-        mock_files.return_value = ["src/new.py"]
+        mock_changes.return_value = {"src/new.py": "A", "src/api/gone.py": "D"}
         mock_analyze.return_value = "minor"
         mock_bump.return_value = "v1.3.0"
 
         result = calculate_semantic_version("develop", "v1.2.0")
 
         assert result == "v1.3.0"
-        mock_files.assert_called_once_with("develop")
-        mock_analyze.assert_called_once_with(["src/new.py"])
+        mock_changes.assert_called_once_with("develop")
+        mock_analyze.assert_called_once_with(["src/new.py", "src/api/gone.py"], {"src/new.py"})
         mock_bump.assert_called_once_with("v1.2.0", "minor")
 
-    @patch("release_lib.semver.get_changed_files")
-    def test_returns_current_version_when_no_changes(self, mock_files):
+    @patch("release_lib.semver.get_changed_file_status")
+    def test_returns_current_version_when_no_changes(self, mock_changes):
         """Should return current version when no files changed."""
-        mock_files.return_value = []
+        mock_changes.return_value = {}
 
         result = calculate_semantic_version("develop", "v1.2.0")
 
@@ -3,19 +3,16 @@
 # SPDX-License-Identifier: Apache-2.0
 """Tests for vcs.operations module."""
 
+import json
 import subprocess
-import sys
-from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
-# Add VCS module to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / ".claude/skills/workflow-utilities/scripts"))
-
-from release_lib.vcs import provider as provider_module
+from release_lib.vcs import operations as operations_module
 from release_lib.vcs.operations import (
     _parse_github_remote,
+    _parse_remote_url,
     _query_azure_review_threads,
     _query_github_review_threads,
     _run,
@@ -30,12 +27,17 @@ from release_lib.vcs.operations import (
 from release_lib.vcs.provider import VCSProvider
 
 
-@pytest.fixture(autouse=True)
-def _clear_provider_cache():
-    """Reset cached provider before each test."""
-    provider_module._cached_provider = None
-    yield
-    provider_module._cached_provider = None
+@pytest.fixture()
+def mock_run(monkeypatch):
+    """Replace ``operations._run`` with a plain ``Mock`` for one test.
+
+    A ``Mock`` rather than the ``MagicMock`` that ``@patch`` builds: the
+    tests only set ``return_value``/``side_effect`` and inspect calls, so the
+    magic-method setup MagicMock does on every construction is wasted.
+    """
+    run = Mock()
+    monkeypatch.setattr(operations_module, "_run", run)
+    return run
 
 
 # ---------------------------------------------------------------------------
@@ -46,29 +48,23 @@ def _clear_provider_cache():
 class TestRun:
     """Tests for _run helper."""
 
-    @patch("subprocess.check_output")
-    def test_returns_stripped_stdout(self, mock_check):
-        mock_check.return_value = "  hello world  \n"
+    def test_returns_stripped_stdout(self, mock_check_output):
+        mock_check_output.return_value = "  hello world  \n"
         assert _run(["echo", "hello"]) == "hello world"
 
-    @patch("subprocess.check_output")
-    def test_file_not_found_raises_runtime(self, mock_check):
-        mock_check.side_effect = FileNotFoundError()
-        with pytest.raises(RuntimeError, match="CLI not found"):
-            _run(["nonexistent"])
-
-    @patch("subprocess.check_output")
-    def test_called_process_error_raises_runtime(self, mock_check):
-        mock_check.side_effect = subprocess.CalledProcessError(1, "gh", stderr="some error")
-        with pytest.raises(RuntimeError, match="some error"):
+    @pytest.mark.parametrize(
+        ("exc", "match"),
+        [
+            (FileNotFoundError(), "CLI not found"),
+            (subprocess.CalledProcessError(1, "gh", stderr="some error"), "some error"),
+            (subprocess.TimeoutExpired("gh", 30), "Timeout"),
+        ],
+    )
+    def test_errors_raise_runtime(self, mock_check_output, exc, match):
+        mock_check_output.side_effect = exc
+        with pytest.raises(RuntimeError, match=match):
             _run(["gh", "pr", "list"])
 
-    @patch("subprocess.check_output")
-    def test_timeout_raises_runtime(self, mock_check):
-        mock_check.side_effect = subprocess.TimeoutExpired("gh", 30)
-        with pytest.raises(RuntimeError, match="Timeout"):
-            _run(["gh", "long-command"])
-
 
 # ---------------------------------------------------------------------------
 # get_username
@@ -78,32 +74,24 @@ class TestRun:
 class TestGetUsername:
     """Tests for get_username function."""
 
-    @patch("release_lib.vcs.operations._run")
-    def test_github_returns_login(self, mock_run):
-        mock_run.return_value = "octocat"
-        result = get_username(provider=VCSProvider.GITHUB)
-        assert result == "octocat"
-        mock_run.assert_called_once_with(["gh", "api", "user", "--jq", ".login"], timeout=10)
-
-    @patch("release_lib.vcs.operations._run")
-    def test_azure_returns_unique_name(self, mock_run):
-        mock_run.return_value = "user@org.com"
-        result = get_username(provider=VCSProvider.AZURE_DEVOPS)
-        assert result == "user@org.com"
-
-    @patch("release_lib.vcs.operations._run")
-    def test_fallback_empty_string_on_error(self, mock_run):
+    @pytest.mark.parametrize(
+        ("provider", "username", "cmd"),
+        [
+            (VCSProvider.GITHUB, "octocat", ["gh", "api", "user", "--jq", ".login"]),
+            (VCSProvider.AZURE_DEVOPS, "user@org.com", ["az", "devops", "user", "show", "--query", "user.uniqueName", "-o", "tsv"]),
+        ],
+    )
+    def test_returns_cli_username(self, mock_run, provider, username, cmd):
+        mock_run.return_value = username
+        assert get_username(provider=provider) == username
+        mock_run.assert_called_once_with(cmd, timeout=10)
+
+    @pytest.mark.parametrize("fallback", ["", "default_user"])
+    def test_fallback_returned_on_error(self, mock_run, fallback):
         mock_run.side_effect = RuntimeError("CLI not found")
-        result = get_username(fallback="", provider=VCSProvider.GITHUB)
-        assert result == ""
+        result = get_username(fallback=fallback, provider=VCSProvider.GITHUB)
+        assert result == fallback
 
-    @patch("release_lib.vcs.operations._run")
-    def test_fallback_custom_value_on_error(self, mock_run):
-        mock_run.side_effect = RuntimeError("CLI not found")
-        result = get_username(fallback="default_user", provider=VCSProvider.GITHUB)
-        assert result == "default_user"
-
-    @patch("release_lib.vcs.operations._run")
     def test_fallback_none_propagates_error(self, mock_run):
         mock_run.side_effect = RuntimeError("auth failed")
         with pytest.raises(RuntimeError, match="auth failed"):
@@ -145,7 +133,6 @@ class TestGetContribBranch:
 class TestCreatePr:
     """Tests for create_pr function."""
 
-    @patch("release_lib.vcs.operations._run")
     def test_github_pr_create(self, mock_run):
         mock_run.return_value = "https://github.com/org/repo/pull/42"
         result = create_pr(
@@ -160,7 +147,6 @@ class TestCreatePr:
         assert cmd[:3] == ["gh", "pr", "create"]
         assert "--fill" not in cmd
 
-    @patch("release_lib.vcs.operations._run")
     def test_github_pr_create_with_fill(self, mock_run):
         mock_run.return_value = "https://github.com/org/repo/pull/42"
         create_pr(
@@ -174,7 +160,6 @@ class TestCreatePr:
         cmd = mock_run.call_args[0][0]
         assert "--fill" in cmd
 
-    @patch("release_lib.vcs.operations._run")
     def test_azure_pr_create(self, mock_run):
         mock_run.return_value = '{"pullRequestId": 99}'
         result = create_pr(
@@ -188,7 +173,6 @@ class TestCreatePr:
         cmd = mock_run.call_args[0][0]
         assert cmd[:4] == ["az", "repos", "pr", "create"]
 
-    @patch("release_lib.vcs.operations._run")
     def test_already_exists_error_propagates(self, mock_run):
         mock_run.side_effect = RuntimeError("a pull request already exists")
         with pytest.raises(RuntimeError, match="already exists"):
@@ -209,13 +193,11 @@ class TestCreatePr:
 class TestCreateRelease:
     """Tests for create_release function."""
 
-    @patch("release_lib.vcs.operations._run")
     def test_github_release(self, mock_run):
         mock_run.return_value = "https://github.com/org/repo/releases/tag/v1.0.0"
         result = create_release("v1.0.0", provider=VCSProvider.GITHUB)
         assert result == "https://github.com/org/repo/releases/tag/v1.0.0"
 
-    @patch("release_lib.vcs.operations._run")
     def test_github_release_gh_not_available(self, mock_run):
         """Should raise RuntimeError when gh CLI is not available."""
         mock_run.side_effect = RuntimeError("'gh' CLI not found")
@@ -235,13 +217,11 @@ class TestCreateRelease:
 class TestCreateIssue:
     """Tests for create_issue function."""
 
-    @patch("release_lib.vcs.operations._run")
     def test_github_issue_basic(self, mock_run):
         mock_run.return_value = "https://github.com/org/repo/issues/10"
         result = create_issue(title="Bug", body="details", provider=VCSProvider.GITHUB)
         assert "issues/10" in result
 
-    @patch("release_lib.vcs.operations._run")
     def test_github_issue_with_labels_and_assignee(self, mock_run):
         mock_run.return_value = "https://github.com/org/repo/issues/10"
         create_issue(
@@ -258,7 +238,6 @@ class TestCreateIssue:
         assert "--assignee" in cmd
         assert "@me" in cmd
 
-    @patch("release_lib.vcs.operations._run")
     def test_azure_work_item(self, mock_run):
         mock_run.return_value = '{"id": 42}'
         result = create_issue(title="Task", body="details", provider=VCSProvider.AZURE_DEVOPS)
@@ -271,44 +250,45 @@ class TestCreateIssue:
 
 
 class TestParseGithubRemote:
-    """Tests for _parse_github_remote helper."""
-
-    @patch("release_lib.vcs.operations.subprocess.check_output")
-    def test_https_url(self, mock_output):
-        mock_output.return_value = "https://github.com/owner/repo.git"
-        owner, repo = _parse_github_remote()
-        assert owner == "owner"
-        assert repo == "repo"
-
-    @patch("release_lib.vcs.operations.subprocess.check_output")
-    def test_ssh_url(self, mock_output):
-        mock_output.return_value = "git@github.com:owner/repo.git"
-        owner, repo = _parse_github_remote()
-        assert owner == "owner"
-        assert repo == "repo"
-
-    @patch("release_lib.vcs.operations.subprocess.check_output")
-    def test_https_url_no_git_suffix(self, mock_output):
-        mock_output.return_value = "https://github.com/owner/repo"
-        owner, repo = _parse_github_remote()
-        assert owner == "owner"
-        assert repo == "repo"
-
-    @patch("release_lib.vcs.operations.subprocess.check_output")
-    def test_unsupported_url_format(self, mock_output):
-        mock_output.return_value = "svn://example.com/owner/repo"
-        with pytest.raises(RuntimeError, match="Unsupported remote URL format"):
-            _parse_github_remote()
-
-    @patch("release_lib.vcs.operations.subprocess.check_output")
-    def test_malformed_url_missing_repo(self, mock_output):
-        mock_output.return_value = "https://github.com/owner"
-        with pytest.raises(RuntimeError, match="Failed to parse owner/repo"):
-            _parse_github_remote()
-
-    @patch("release_lib.vcs.operations.subprocess.check_output")
-    def test_git_not_found(self, mock_output):
-        mock_output.side_effect = FileNotFoundError("git not found")
+    """Tests for _parse_github_remote and its pure _parse_remote_url core."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://github.com/owner/repo.git",
+            "git@github.com:owner/repo.git",
+            "https://github.com/owner/repo",
+        ],
+    )
+    def test_parses_owner_and_repo(self, url):
+        assert _parse_remote_url(url) == ("owner", "repo")
+
+    @pytest.mark.parametrize(
+        ("url", "match"),
+        [
+            ("svn://example.com/owner/repo", "Unsupported remote URL format"),
+            ("https://github.com/owner", "Failed to parse owner/repo"),
+        ],
+    )
+    def test_malformed_url_raises(self, url, match):
+        with pytest.raises(RuntimeError, match=match):
+            _parse_remote_url(url)
+
+    @pytest.fixture()
+    def _clear_remote_cache(self, monkeypatch):
+        monkeypatch.setattr(operations_module, "_cached_github_remote", None)
+
+    @pytest.mark.usefixtures("_clear_remote_cache")
+    def test_reads_origin_url_once(self, mock_check_output):
+        mock_check_output.return_value = "https://github.com/owner/repo.git\n"
+        assert _parse_github_remote() == ("owner", "repo")
+        assert _parse_github_remote() == ("owner", "repo")
+        mock_check_output.assert_called_once()
+        assert mock_check_output.call_args[0][0] == ["git", "config", "--get", "remote.origin.url"]
+
+    @pytest.mark.usefixtures("_clear_remote_cache")
+    def test_git_not_found(self, mock_check_output):
+        mock_check_output.side_effect = FileNotFoundError("git not found")
         with pytest.raises(RuntimeError, match="Failed to read git remote URL"):
             _parse_github_remote()
 
@@ -318,67 +298,55 @@ class TestParseGithubRemote:
 # ---------------------------------------------------------------------------
 
 
+def _graphql_response(*threads: tuple[str, bool, list[dict]]) -> str:
+    """Build a review-threads GraphQL response for PR 42 as a JSON string.
+
+    Each thread is ``(id, is_resolved, comment_nodes)``.
+    """
+    nodes = [{"id": thread_id, "isResolved": resolved, "comments": {"nodes": comments}} for thread_id, resolved, comments in threads]
+    pull_request = {"url": "https://github.com/owner/repo/pull/42", "reviewThreads": {"nodes": nodes}}
+    return json.dumps({"data": {"repository": {"pullRequest": pull_request}}})
+
+
 class TestQueryGithubReviewThreads:
     """Tests for _query_github_review_threads."""
 
-    GRAPHQL_RESPONSE = {
-        "data": {
-            "repository": {
-                "pullRequest": {
-                    "url": "https://github.com/owner/repo/pull/42",
-                    "reviewThreads": {
-                        "nodes": [
-                            {
-                                "id": "thread-1",
-                                "isResolved": False,
-                                "comments": {
-                                    "nodes": [
-                                        {
-                                            "url": "https://github.com/owner/repo/pull/42#discussion_thread-1",
-                                            "path": "src/main.py",
-                                            "line": 10,
-                                            "author": {"login": "reviewer"},
-                                            "body": "Fix this bug",
-                                            "createdAt": "2025-01-15T12:00:00Z",
-                                        }
-                                    ]
-                                },
-                            },
-                            {
-                                "id": "thread-2",
-                                "isResolved": True,
-                                "comments": {
-                                    "nodes": [
-                                        {
-                                            "url": "https://github.com/owner/repo/pull/42#discussion_thread-2",
-                                            "path": "src/utils.py",
-                                            "line": 20,
-                                            "author": {"login": "reviewer"},
-                                            "body": "Already resolved",
-                                            "createdAt": "2025-01-14T12:00:00Z",
-                                        }
-                                    ]
-                                },
-                            },
-                            {
-                                "id": "thread-3",
-                                "isResolved": False,
-                                "comments": {"nodes": []},
-                            },
-                        ]
-                    },
+    GRAPHQL_RESPONSE_JSON = _graphql_response(
+        (
+            "thread-1",
+            False,
+            [
+                {
+                    "url": "https://github.com/owner/repo/pull/42#discussion_thread-1",
+                    "path": "src/main.py",
+                    "line": 10,
+                    "author": {"login": "reviewer"},
+                    "body": "Fix this bug",
+                    "createdAt": "2025-01-15T12:00:00Z",
                 }
-            }
-        }
-    }
+            ],
+        ),
+        (
+            "thread-2",
+            True,
+            [
+                {
+                    "url": "https://github.com/owner/repo/pull/42#discussion_thread-2",
+                    "path": "src/utils.py",
+                    "line": 20,
+                    "author": {"login": "reviewer"},
+                    "body": "Already resolved",
+                    "createdAt": "2025-01-14T12:00:00Z",
+                }
+            ],
+        ),
+        ("thread-3", False, []),
+    )
 
     @patch("release_lib.vcs.operations._parse_github_remote", return_value=("owner", "repo"))
-    @patch("release_lib.vcs.operations._run")
-    def test_filters_resolved_and_empty_threads(self, mock_run, _mock_remote):
+    def test_filters_resolved_and_empty_threads(self, _mock_remote, mock_run):
         """Should return only unresolved threads with comments."""
-        import json
-
-        mock_run.return_value = json.dumps(self.GRAPHQL_RESPONSE)
+        mock_run.return_value = self.GRAPHQL_RESPONSE_JSON
 
         result = _query_github_review_threads(42)
 
@@ -390,8 +358,7 @@ class TestQueryGithubReviewThreads:
         assert result[0]["body"] == "Fix this bug"
 
     @patch("release_lib.vcs.operations._parse_github_remote", return_value=("owner", "repo"))
-    @patch("release_lib.vcs.operations._run")
-    def test_invalid_json_raises(self, mock_run, _mock_remote):
+    def test_invalid_json_raises(self, _mock_remote, mock_run):
         """Should raise RuntimeError on invalid JSON."""
         mock_run.return_value = "not-json"
 
@@ -399,48 +366,17 @@ class TestQueryGithubReviewThreads:
             _query_github_review_threads(42)
 
     @patch("release_lib.vcs.operations._parse_github_remote", return_value=("owner", "repo"))
-    @patch("release_lib.vcs.operations._run")
-    def test_missing_keys_raises(self, mock_run, _mock_remote):
+    def test_missing_keys_raises(self, _mock_remote, mock_run):
         """Should raise RuntimeError on unexpected response structure."""
-        import json
-
         mock_run.return_value = json.dumps({"data": {}})
 
         with pytest.raises(RuntimeError, match="Failed to parse GitHub review threads"):
             _query_github_review_threads(42)
 
     @patch("release_lib.vcs.operations._parse_github_remote", return_value=("owner", "repo"))
-    @patch("release_lib.vcs.operations._run")
-    def test_handles_missing_author(self, mock_run, _mock_remote):
+    def test_handles_missing_author(self, _mock_remote, mock_run):
         """Should use 'Unknown' when comment has no author."""
-        import json
-
-        response = {
-            "data": {
-                "repository": {
-                    "pullRequest": {
-                        "url": "https://github.com/owner/repo/pull/42",
-                        "reviewThreads": {
-                            "nodes": [
-                                {
-                                    "id": "thread-1",
-                                    "isResolved": False,
-                                    "comments": {
-                                        "nodes": [
-                                            {
-                                                "body": "comment",
-                                                "createdAt": "2025-01-15T12:00:00Z",
-                                            }
-                                        ]
-                                    },
-                                }
-                            ]
-                        },
-                    }
-                }
-            }
-        }
-        mock_run.return_value = json.dumps(response)
+        mock_run.return_value = _graphql_response(("thread-1", False, [{"body": "comment", "createdAt": "2025-01-15T12:00:00Z"}]))
 
         result = _query_github_review_threads(42)
 
@@ -455,12 +391,8 @@ class TestQueryGithubReviewThreads:
 class TestQueryAzureReviewThreads:
     """Tests for _query_azure_review_threads."""
 
-    @patch("release_lib.vcs.operations._run")
-    def test_parses_azure_threads(self, mock_run):
-        """Should parse Azure DevOps thread response."""
-        import json
-
-        threads = [
+    THREADS_JSON = json.dumps(
+        [
             {
                 "id": 1,
                 "comments": [
@@ -472,7 +404,11 @@ class TestQueryAzureReviewThreads:
                 ],
             }
         ]
-        mock_run.return_value = json.dumps(threads)
+    )
+
+    def test_parses_azure_threads(self, mock_run):
+        """Should parse Azure DevOps thread response."""
+        mock_run.return_value = self.THREADS_JSON
 
         result = _query_azure_review_threads(42)
 
@@ -481,11 +417,8 @@ class TestQueryAzureReviewThreads:
         assert result[0]["author"] == "user@org.com"
         assert result[0]["body"] == "Please fix"
 
-    @patch("release_lib.vcs.operations._run")
     def test_skips_threads_without_comments(self, mock_run):
         """Should skip threads that have no comments."""
-        import json
-
         threads = [{"id": 1, "comments": []}, {"id": 2}]
         mock_run.return_value = json.dumps(threads)
 
@@ -493,7 +426,6 @@ class TestQueryAzureReviewThreads:
 
         assert len(result) == 0
 
-    @patch("release_lib.vcs.operations._run")
     def test_handles_null_response(self, mock_run):
         """Should handle null/empty response."""
         mock_run.return_value = "null"
@@ -502,7 +434,6 @@ class TestQueryAzureReviewThreads:
 
         assert result == []
 
-    @patch("release_lib.vcs.operations._run")
     def test_invalid_json_raises(self, mock_run):
         """Should raise RuntimeError on invalid JSON."""
         mock_run.return_value = "not-json"
@@ -542,22 +473,33 @@ class TestQueryPrReviewThreads:
 class TestCheckAuth:
     """Tests for check_auth function."""
 
-    @patch("release_lib.vcs.operations._run")
-    def test_github_authenticated(self, mock_run):
+    @pytest.fixture(autouse=True)
+    def _clear_auth_cache(self, monkeypatch):
+        monkeypatch.setattr(operations_module, "_authenticated_providers", set())
+
+    @pytest.mark.parametrize(
+        ("provider", "outcome", "expected"),
+        [
+            (VCSProvider.GITHUB, "Logged in", True),
+            (VCSProvider.GITHUB, RuntimeError("not authenticated"), False),
+            (VCSProvider.AZURE_DEVOPS, "account info", True),
+            (VCSProvider.AZURE_DEVOPS, RuntimeError("not logged in"), False),
+        ],
+    )
+    def test_check_auth(self, mock_run, provider, outcome, expected):
+        if isinstance(outcome, Exception):
+            mock_run.side_effect = outcome
+        else:
+            mock_run.return_value = outcome
+        assert check_auth(provider=provider) is expected
+
+    def test_success_is_cached(self, mock_run):
         mock_run.return_value = "Logged in"
         assert check_auth(provider=VCSProvider.GITHUB) is True
+        assert check_auth(provider=VCSProvider.GITHUB) is True
+        mock_run.assert_called_once()
 
-    @patch("release_lib.vcs.operations._run")
-    def test_github_not_authenticated(self, mock_run):
-        mock_run.side_effect = RuntimeError("not authenticated")
+    def test_failure_is_rechecked(self, mock_run):
+        mock_run.side_effect = [RuntimeError("not authenticated"), "Logged in"]
         assert check_auth(provider=VCSProvider.GITHUB) is False
-
-    @patch("release_lib.vcs.operations._run")
-    def test_azure_authenticated(self, mock_run):
-        mock_run.return_value = "account info"
-        assert check_auth(provider=VCSProvider.AZURE_DEVOPS) is True
-
-    @patch("release_lib.vcs.operations._run")
-    def test_azure_not_authenticated(self, mock_run):
-        mock_run.side_effect = RuntimeError("not logged in")
-        assert check_auth(provider=VCSProvider.AZURE_DEVOPS) is False
+        assert check_auth(provider=VCSProvider.GITHUB) is True
@@ -4,27 +4,12 @@
 """Tests for vcs.provider module."""
 
 import subprocess
-import sys
-from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
-# Add VCS module to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / ".claude/skills/workflow-utilities/scripts"))
-
-from release_lib.vcs import provider as provider_module
 from release_lib.vcs.provider import VCSProvider, detect_provider
 
 
-@pytest.fixture(autouse=True)
-def _clear_provider_cache():
-    """Reset cached provider before each test."""
-    provider_module._cached_provider = None
-    yield
-    provider_module._cached_provider = None
-
-
 class TestVCSProvider:
     """Tests for VCSProvider enum."""
 
@@ -35,63 +20,46 @@ class TestVCSProvider:
         assert VCSProvider.AZURE_DEVOPS.value == "azure_devops"
 
 
+@pytest.mark.usefixtures("_clear_provider_cache")
 class TestDetectProvider:
     """Tests for detect_provider function."""
 
-    @patch("subprocess.check_output")
-    def test_github_https_url(self, mock_check):
-        mock_check.return_value = "https://github.com/user/repo.git\n"
-        result = detect_provider()
-        assert result == VCSProvider.GITHUB
-
-    @patch("subprocess.check_output")
-    def test_github_ssh_url(self, mock_check):
-        mock_check.return_value = "git@github.com:user/repo.git\n"
-        result = detect_provider()
-        assert result == VCSProvider.GITHUB
-
-    @patch("subprocess.check_output")
-    def test_azure_devops_url(self, mock_check):
-        mock_check.return_value = "https://dev.azure.com/org/project/_git/repo\n"
-        result = detect_provider()
-        assert result == VCSProvider.AZURE_DEVOPS
-
-    @patch("subprocess.check_output")
-    def test_visualstudio_url(self, mock_check):
-        mock_check.return_value = "https://org.visualstudio.com/project/_git/repo\n"
-        result = detect_provider()
-        assert result == VCSProvider.AZURE_DEVOPS
-
-    @patch("subprocess.check_output")
-    def test_unknown_url_raises(self, mock_check):
-        mock_check.return_value = "https://gitlab.com/user/repo.git\n"
-        with pytest.raises(RuntimeError, match="Unrecognised VCS provider"):
-            detect_provider()
-
-    @patch("subprocess.check_output")
-    def test_git_not_found_raises(self, mock_check):
-        mock_check.side_effect = FileNotFoundError()
-        with pytest.raises(RuntimeError, match="'git' CLI not found"):
-            detect_provider()
-
-    @patch("subprocess.check_output")
-    def test_git_command_fails_raises(self, mock_check):
-        mock_check.side_effect = subprocess.CalledProcessError(1, "git", stderr="fatal: not a git repo")
-        with pytest.raises(RuntimeError, match="Failed to read git remote URL"):
-            detect_provider()
-
-    @patch("subprocess.check_output")
-    def test_timeout_raises(self, mock_check):
-        mock_check.side_effect = subprocess.TimeoutExpired("git", 10)
-        with pytest.raises(RuntimeError, match="Timeout"):
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://github.com/user/repo.git\n", VCSProvider.GITHUB),
+            ("git@github.com:user/repo.git\n", VCSProvider.GITHUB),
+            ("https://dev.azure.com/org/project/_git/repo\n", VCSProvider.AZURE_DEVOPS),
+            ("https://org.visualstudio.com/project/_git/repo\n", VCSProvider.AZURE_DEVOPS),
+        ],
+    )
+    def test_detects_provider_from_remote_url(self, mock_check_output, url, expected):
+        mock_check_output.return_value = url
+        assert detect_provider() == expected
+
+    @pytest.mark.parametrize(
+        ("outcome", "match"),
+        [
+            ("https://gitlab.com/user/repo.git\n", "Unrecognised VCS provider"),
+            (FileNotFoundError(), "'git' CLI not found"),
+            (subprocess.CalledProcessError(1, "git", stderr="fatal: not a git repo"), "Failed to read git remote URL"),
+            (subprocess.TimeoutExpired("git", 10), "Timeout"),
+        ],
+    )
+    def test_errors_raise_runtime(self, mock_check_output, outcome, match):
+        """An unknown remote URL, or a failed git call, raises RuntimeError."""
+        if isinstance(outcome, Exception):
+            mock_check_output.side_effect = outcome
+        else:
+            mock_check_output.return_value = outcome
+        with pytest.raises(RuntimeError, match=match):
             detect_provider()
 
-    @patch("subprocess.check_output")
-    def test_caching_avoids_repeated_calls(self, mock_check):
-        mock_check.return_value = "https://github.com/user/repo.git\n"
+    def test_caching_avoids_repeated_calls(self, mock_check_output):
+        mock_check_output.return_value = "https://github.com/user/repo.git\n"
 
         result1 = detect_provider()
         result2 = detect_provider()
 
         assert result1 == result2 == VCSProvider.GITHUB
-        assert mock_check.call_count == 1  # Only called once due to caching
+        assert mock_check_output.call_count == 1  # Only called once due to caching
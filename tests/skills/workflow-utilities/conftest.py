@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2025 stharrold
+# SPDX-License-Identifier: Apache-2.0
+"""Shared setup for workflow-utilities skill tests.
+
+pytest imports this conftest once per process, before any test module in
+this directory, so the scripts directory is put on ``sys.path`` a single
+time and the test modules can import the skill scripts directly.
+"""
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[3] / ".claude" / "skills" / "workflow-utilities" / "scripts"
+
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
@@ -11,10 +11,6 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-
-# Add the scripts directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / ".claude" / "skills" / "workflow-utilities" / "scripts"))
-
 from archive_manager import create_archive, ensure_archived_directory, get_repo_root
 
 
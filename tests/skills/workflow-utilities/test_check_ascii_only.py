@@ -4,17 +4,9 @@
 """Tests for check_ascii_only.py edge cases."""
 
 import os
-import sys
 from pathlib import Path
 
 import pytest
-
-# Add the scripts directory to the path for imports
-sys.path.insert(
-    0,
-    str(Path(__file__).parent.parent.parent.parent / ".claude" / "skills" / "workflow-utilities" / "scripts"),
-)
-
 from check_ascii_only import (
     ASCII_REPLACEMENTS,
     check_file,
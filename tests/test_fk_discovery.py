@@ -4,8 +4,6 @@
 
 from __future__ import annotations
 
-from uuid import uuid4
-
 from data_catalog.db.models import Asset
 from data_catalog.services.fk_discovery import FKDiscoveryService
 from data_catalog.services.fk_patterns import (
@@ -14,6 +12,7 @@ from data_catalog.services.fk_patterns import (
     FKPatternRegistry,
     SameNamePattern,
 )
+from tests._factory import asset_row
 
 
 class TestFKPatterns:
@@ -69,12 +68,7 @@ class TestFKDiscoveryService:
 
     def test_discover_candidates(self, db):
         pk_asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Customers]",
-            table_schema="dbo",
-            table_name="Customers",
-            asset_type="table",
-            source_system="test",
+            **asset_row("dbo", "Customers"),
             schema_metadata={
                 "primary_key": ["CustomerID"],
                 "grain_status": "confirmed",
@@ -82,12 +76,7 @@ class TestFKDiscoveryService:
             },
         )
         fk_asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Orders]",
-            table_schema="dbo",
-            table_name="Orders",
-            asset_type="table",
-            source_system="test",
+            **asset_row("dbo", "Orders"),
             schema_metadata={
                 "columns": [
                     {"name": "OrderID"},
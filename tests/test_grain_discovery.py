@@ -4,10 +4,9 @@
 
 from __future__ import annotations
 
-from uuid import uuid4
-
 from data_catalog.db.models import Asset
 from data_catalog.models.data_model import GrainResult
+from tests._factory import asset_row
 
 
 class TestGrainResult:
@@ -62,12 +61,7 @@ class TestGrainDiscoveryPatterns:
     def test_asset_with_existing_pk(self, db):
         """Assets with PK in schema_metadata should be returned directly."""
         asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Customers]",
-            table_schema="dbo",
-            table_name="Customers",
-            asset_type="table",
-            source_system="test",
+            **asset_row("dbo", "Customers"),
             schema_metadata={
                 "primary_key": ["CustomerID"],
                 "grain_status": "confirmed",
@@ -87,12 +81,7 @@ class TestGrainDiscoveryPatterns:
     def test_asset_no_natural_pk(self, db):
         """Assets marked as no_natural_pk should be queryable."""
         asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[AuditLog]",
-            table_schema="dbo",
-            table_name="AuditLog",
-            asset_type="table",
-            source_system="test",
+            **asset_row("dbo", "AuditLog"),
             schema_metadata={
                 "grain_status": "no_natural_pk",
                 "columns": [
@@ -4,97 +4,76 @@
 
 from __future__ import annotations
 
-from uuid import uuid4
+import networkx as nx
+import pytest
 
 from data_catalog.db.models import Asset, Relationship
 from data_catalog.services.graph_metrics import GraphMetricsService
+from tests._factory import asset_row, relationship_row
+
+
+def _seed_graph(db):
+    """Create a small graph for testing."""
+    names = ["Customers", "Orders", "Products", "OrderItems"]
+    assets = [asset_row("dbo", name) for name in names]
+    db.bulk_insert_mappings(Asset, assets)
+
+    # Orders -> Customers, OrderItems -> Orders, OrderItems -> Products
+    edges = [(1, 0, "CustomerID"), (3, 1, "OrderID"), (3, 2, "ProductID")]
+    db.bulk_insert_mappings(
+        Relationship,
+        [
+            relationship_row(
+                assets[parent]["id"],
+                assets[referenced]["id"],
+                column_mappings=[{"parent": column, "referenced": column}],
+                is_validated=True,
+            )
+            for parent, referenced, column in edges
+        ],
+    )
+    db.commit()
+    return assets
+
+
+@pytest.fixture(scope="class")
+def seeded_graph(class_db):
+    """Seed the graph and build it once for the whole test class."""
+    _seed_graph(class_db)
+    service = GraphMetricsService(class_db)
+    return service, service.build_graph()
 
 
 class TestGraphMetricsService:
     """Tests for GraphMetricsService."""
 
-    def _seed_graph(self, db):
-        """Create a small graph for testing."""
-        assets = []
-        for name in ["Customers", "Orders", "Products", "OrderItems"]:
-            a = Asset(
-                id=str(uuid4()),
-                qualified_name=f"[dbo].[{name}]",
-                table_schema="dbo",
-                table_name=name,
-                asset_type="table",
-                source_system="test",
-            )
-            db.add(a)
-            assets.append(a)
-        db.commit()
-
-        # Orders -> Customers
-        db.add(
-            Relationship(
-                id=str(uuid4()),
-                parent_asset_id=assets[1].id,
-                referenced_asset_id=assets[0].id,
-                relationship_type="foreign_key",
-                column_mappings=[{"parent": "CustomerID", "referenced": "CustomerID"}],
-                is_validated=True,
-            )
-        )
-        # OrderItems -> Orders
-        db.add(
-            Relationship(
-                id=str(uuid4()),
-                parent_asset_id=assets[3].id,
-                referenced_asset_id=assets[1].id,
-                relationship_type="foreign_key",
-                column_mappings=[{"parent": "OrderID", "referenced": "OrderID"}],
-                is_validated=True,
-            )
-        )
-        # OrderItems -> Products
-        db.add(
-            Relationship(
-                id=str(uuid4()),
-                parent_asset_id=assets[3].id,
-                referenced_asset_id=assets[2].id,
-                relationship_type="foreign_key",
-                column_mappings=[{"parent": "ProductID", "referenced": "ProductID"}],
-                is_validated=True,
-            )
-        )
-        db.commit()
-        return assets
-
-    def test_build_graph(self, db):
-        assets = self._seed_graph(db)
-        service = GraphMetricsService(db)
-        graph = service.build_graph()
+    def test_build_graph(self, seeded_graph):
+        _, graph = seeded_graph
 
         assert graph.number_of_nodes() == 4
         assert graph.number_of_edges() == 3
 
-    def test_compute_pagerank(self, db):
-        self._seed_graph(db)
-        service = GraphMetricsService(db)
-        graph = service.build_graph()
+    def test_compute_pagerank(self, seeded_graph):
+        service, graph = seeded_graph
         pagerank = service.compute_pagerank(graph)
 
         assert len(pagerank) == 4
         # All values sum to ~1.0
         assert abs(sum(pagerank.values()) - 1.0) < 0.01
 
-    def test_detect_communities(self, db):
-        self._seed_graph(db)
-        service = GraphMetricsService(db)
-        graph = service.build_graph()
+    def test_compute_pagerank_matches_networkx(self, seeded_graph):
+        service, graph = seeded_graph
+        assert service.compute_pagerank(graph) == pytest.approx(nx.pagerank(graph))
+
+    def test_detect_communities(self, seeded_graph):
+        service, graph = seeded_graph
         communities = service.detect_communities(graph)
 
         # Should detect at least 1 community
         assert len(communities) >= 1
 
-    def test_analyze(self, db):
-        self._seed_graph(db)
-        service = GraphMetricsService(db)
+    def test_analyze(self, seeded_graph):
+        service, _ = seeded_graph
         results = service.analyze()
 
         assert results["nodes"] == 4
@@ -102,9 +81,21 @@ class TestGraphMetricsService:
         assert "communities" in results
         assert "top_pagerank" in results
 
+
+class TestGraphMetricsServiceEmpty:
+    """Tests for GraphMetricsService on an empty catalog."""
+
     def test_empty_graph(self, db):
         service = GraphMetricsService(db)
         results = service.analyze()
 
         assert results["nodes"] == 0
         assert results["edges"] == 0
+
+    def test_build_graph_is_memoized_until_refresh(self, db):
+        service = GraphMetricsService(db)
+        graph = service.build_graph()
+        _seed_graph(db)
+
+        assert service.build_graph() is graph
+        assert service.build_graph(refresh=True).number_of_nodes() == 4
@@ -4,8 +4,6 @@
 
 from __future__ import annotations
 
-from uuid import uuid4
-
 from data_catalog.db.models import (
     Asset,
     ColumnCardinalityHistory,
@@ -14,20 +12,26 @@ from data_catalog.db.models import (
     Relationship,
     SearchIndexColumn,
 )
+from tests._factory import asset_row, new_id, relationship_row
+
+# Built once at import. The JSON column serialises the dict on flush and never
+# mutates it, so tests can share it.
+_ORDERS_METADATA = {
+    "columns": [
+        {"name": "OrderID", "data_type": "int"},
+        {"name": "CustomerID", "data_type": "int"},
+    ],
+    "primary_key": ["OrderID"],
+    "grain_status": "confirmed",
+}
+_CUSTOMER_ID_MAPPING = [{"parent": "CustomerID", "referenced": "CustomerID"}]
 
 
 class TestAssetModel:
     """Tests for the Asset model."""
 
     def test_create_asset(self, db):
-        asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Customers]",
-            table_schema="dbo",
-            table_name="Customers",
-            asset_type="table",
-            source_system="test",
-        )
+        asset = Asset(**asset_row("dbo", "Customers"))
         db.add(asset)
         db.commit()
 
@@ -39,20 +43,8 @@ class TestAssetModel:
 
     def test_asset_schema_metadata(self, db):
         asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Orders]",
-            table_schema="dbo",
-            table_name="Orders",
-            asset_type="table",
-            source_system="test",
-            schema_metadata={
-                "columns": [
-                    {"name": "OrderID", "data_type": "int"},
-                    {"name": "CustomerID", "data_type": "int"},
-                ],
-                "primary_key": ["OrderID"],
-                "grain_status": "confirmed",
-            },
+            **asset_row("dbo", "Orders"),
+            schema_metadata=_ORDERS_METADATA,
         )
         db.add(asset)
         db.commit()
@@ -64,12 +56,7 @@ class TestAssetModel:
 
     def test_asset_statistics(self, db):
         asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Products]",
-            table_schema="dbo",
-            table_name="Products",
-            asset_type="table",
-            source_system="test",
+            **asset_row("dbo", "Products"),
             statistics={"row_count": 1000000},
         )
         db.add(asset)
@@ -83,33 +70,12 @@ class TestRelationshipModel:
     """Tests for the Relationship model."""
 
     def test_create_relationship(self, db):
-        parent = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Orders]",
-            table_schema="dbo",
-            table_name="Orders",
-            asset_type="table",
-            source_system="test",
-        )
-        child = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Customers]",
-            table_schema="dbo",
-            table_name="Customers",
-            asset_type="table",
-            source_system="test",
-        )
+        parent = Asset(**asset_row("dbo", "Orders"))
+        child = Asset(**asset_row("dbo", "Customers"))
         db.add_all([parent, child])
-        db.commit()
+        db.flush()
 
-        rel = Relationship(
-            id=str(uuid4()),
-            parent_asset_id=parent.id,
-            referenced_asset_id=child.id,
-            relationship_type="foreign_key",
-            column_mappings=[{"parent": "CustomerID", "referenced": "CustomerID"}],
-            is_validated=True,
-        )
+        rel = Relationship(**relationship_row(parent.id, child.id, column_mappings=_CUSTOMER_ID_MAPPING, is_validated=True))
         db.add(rel)
         db.commit()
 
@@ -124,19 +90,12 @@ class TestColumnModels:
     """Tests for column-related models."""
 
     def test_column_cardinality(self, db):
-        asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Orders]",
-            table_schema="dbo",
-            table_name="Orders",
-            asset_type="table",
-            source_system="test",
-        )
+        asset = Asset(**asset_row("dbo", "Orders"))
         db.add(asset)
-        db.commit()
+        db.flush()
 
         record = ColumnCardinalityHistory(
-            cardinality_id=str(uuid4()),
+            cardinality_id=new_id(),
             asset_id=asset.id,
             table_schema="dbo",
             table_name="Orders",
@@ -154,19 +113,12 @@ class TestColumnModels:
         assert loaded.cardinality_at_1pct == 500
 
     def test_column_frequency(self, db):
-        asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Orders]",
-            table_schema="dbo",
-            table_name="Orders",
-            asset_type="table",
-            source_system="test",
-        )
+        asset = Asset(**asset_row("dbo", "Orders"))
         db.add(asset)
-        db.commit()
+        db.flush()
 
         freq = ColumnValueFrequency(
-            id=str(uuid4()),
+            id=new_id(),
             asset_id=asset.id,
             table_schema="dbo",
             table_name="Orders",
@@ -184,19 +136,12 @@ class TestColumnModels:
         assert loaded.frequency == 5000
 
     def test_column_vector(self, db):
-        asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Orders]",
-            table_schema="dbo",
-            table_name="Orders",
-            asset_type="table",
-            source_system="test",
-        )
+        asset = Asset(**asset_row("dbo", "Orders"))
         db.add(asset)
-        db.commit()
+        db.flush()
 
         vector = ColumnVector(
-            id=str(uuid4()),
+            id=new_id(),
             asset_id=asset.id,
             table_schema="dbo",
             table_name="Orders",
@@ -213,19 +158,12 @@ class TestColumnModels:
         assert len(loaded.value_vector) == 384
 
     def test_search_index_column(self, db):
-        asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Orders]",
-            table_schema="dbo",
-            table_name="Orders",
-            asset_type="table",
-            source_system="test",
-        )
+        asset = Asset(**asset_row("dbo", "Orders"))
         db.add(asset)
-        db.commit()
+        db.flush()
 
         entry = SearchIndexColumn(
-            id=str(uuid4()),
+            id=new_id(),
             asset_id=asset.id,
             table_schema="dbo",
             table_name="Orders",
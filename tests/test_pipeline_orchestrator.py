@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
-from uuid import uuid4
+from datetime import UTC, datetime, timedelta
+
+import pytest
 
 from data_catalog.db.models import PipelinePhaseLog
 from data_catalog.services.pipeline_orchestrator import (
@@ -12,6 +14,10 @@ from data_catalog.services.pipeline_orchestrator import (
     PipelineConfig,
     PipelineResult,
 )
+from tests._factory import new_id
+
+# Shared start time for every constructed result and log row.
+BASE_TS = datetime(2025, 1, 1, tzinfo=UTC)
 
 
 class TestPipelineConfig:
@@ -41,12 +47,10 @@ class TestPipelineResult:
     """Tests for PipelineResult dataclass."""
 
     def test_to_dict(self):
-        from datetime import UTC, datetime
-
         result = PipelineResult(
             schema_name="dbo",
-            started_at=datetime(2025, 1, 1, tzinfo=UTC),
-            completed_at=datetime(2025, 1, 1, 0, 5, tzinfo=UTC),
+            started_at=BASE_TS,
+            completed_at=BASE_TS + timedelta(minutes=5),
             total_duration_seconds=300.0,
             status="success",
             pk_discovered=10,
@@ -63,50 +67,38 @@ class TestPipelineResult:
 class TestPhaseResult:
     """Tests for PhaseResult dataclass."""
 
-    def test_success(self):
-        from datetime import UTC, datetime
-
+    @pytest.mark.parametrize(
+        ("status", "errors", "duration_seconds"),
+        [("success", [], 60.0), ("error", ["Connection timeout"], 0.5)],
+    )
+    def test_status_and_errors(self, status, errors, duration_seconds):
         result = PhaseResult(
             phase_name="pk_discovery",
-            status="success",
-            started_at=datetime(2025, 1, 1, tzinfo=UTC),
-            completed_at=datetime(2025, 1, 1, 0, 1, tzinfo=UTC),
-            duration_seconds=60.0,
+            status=status,
+            started_at=BASE_TS,
+            completed_at=BASE_TS + timedelta(seconds=duration_seconds),
+            duration_seconds=duration_seconds,
             items_processed=50,
             items_total=50,
+            errors=errors,
         )
-        assert result.status == "success"
+        assert result.status == status
         assert result.items_processed == 50
-
-    def test_error(self):
-        from datetime import UTC, datetime
-
-        result = PhaseResult(
-            phase_name="fk_validation",
-            status="error",
-            started_at=datetime(2025, 1, 1, tzinfo=UTC),
-            completed_at=datetime(2025, 1, 1, tzinfo=UTC),
-            duration_seconds=0.5,
-            errors=["Connection timeout"],
-        )
-        assert result.status == "error"
-        assert len(result.errors) == 1
+        assert result.errors == errors
 
 
 class TestPipelinePhaseLog:
     """Tests for PipelinePhaseLog model persistence."""
 
     def test_log_phase(self, db):
-        from datetime import UTC, datetime
-
         log = PipelinePhaseLog(
-            id=str(uuid4()),
-            run_id=str(uuid4()),
+            id=new_id(),
+            run_id=new_id(),
             schema_pattern="dbo",
             phase_name="pk_discovery",
             status="success",
-            started_at=datetime(2025, 1, 1, tzinfo=UTC),
-            completed_at=datetime(2025, 1, 1, 0, 1, tzinfo=UTC),
+            started_at=BASE_TS,
+            completed_at=BASE_TS + timedelta(minutes=1),
             duration_seconds=60.0,
             items_processed=50,
         )
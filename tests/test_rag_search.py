@@ -4,9 +4,11 @@
 
 from __future__ import annotations
 
-from uuid import uuid4
+import functools
+import hashlib
 
 import numpy as np
+import pytest
 
 from data_catalog.db.models import (
     Asset,
@@ -14,90 +16,121 @@ from data_catalog.db.models import (
     SearchIndexColumn,
 )
 from data_catalog.services.rag_search import RAGSearchService
+from tests._factory import asset_row, new_id
+
+_SEED_COLUMNS = [
+    ("CustomerID", "Unique identifier for the customer"),
+    ("CustomerName", "Full name of the customer"),
+]
+
+
+def _seed_vectors(n: int) -> list[tuple[list[float], str]]:
+    """Draw ``n`` unit vectors in one batch as (JSON-ready list, bitstring) pairs."""
+    vecs = np.random.default_rng(0).standard_normal((n, 384), dtype=np.float32)
+    vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+    chars = np.where(vecs > 0, ord("1"), ord("0")).astype(np.uint8)
+    return [(vec.tolist(), row.tobytes().decode("ascii")) for vec, row in zip(vecs, chars, strict=True)]
+
+
+# One vector per seeded column, drawn in a single batched RNG call and built
+# once at import instead of per seeded row.
+_SEED_VECTORS = _seed_vectors(len(_SEED_COLUMNS))
+
+
+@functools.lru_cache(maxsize=256)
+def _mock_embedding(text: str) -> bytes:
+    """Deterministic unit vector for ``text``, cached as raw float32 bytes.
+
+    Seeded from blake2b so results do not depend on PYTHONHASHSEED.
+    """
+    seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+    vec = np.random.default_rng(seed).standard_normal(384).astype(np.float32)
+    return (vec / np.linalg.norm(vec)).tobytes()
 
 
 class _MockEmbedder:
     """Mock embedding service that returns normalized random vectors."""
 
     def embed_query(self, text: str) -> np.ndarray:
-        rng = np.random.default_rng(hash(text) % (2**31))
-        vec = rng.standard_normal(384).astype(np.float32)
-        return vec / np.linalg.norm(vec)
+        return np.frombuffer(_mock_embedding(text), dtype=np.float32)
+
+
+def _seed_searchable(db):
+    """Seed assets with vectors for search testing."""
+    asset = asset_row(
+        "dbo",
+        "Customers",
+        schema_metadata={
+            "columns": [
+                {"name": "CustomerID", "data_type": "int"},
+                {"name": "CustomerName", "data_type": "varchar"},
+            ],
+        },
+    )
+    db.bulk_insert_mappings(Asset, [asset])
+
+    entries = []
+    vectors = []
+    for (col_name, desc), (value_vector, vector_bits) in zip(_SEED_COLUMNS, _SEED_VECTORS, strict=True):
+        entries.append(
+            {
+                "id": new_id(),
+                "asset_id": asset["id"],
+                "table_schema": "dbo",
+                "table_name": "Customers",
+                "column_name": col_name,
+                "data_type": "varchar",
+                "ordinal_position": 1,
+                "description": desc,
+            }
+        )
+
+        vectors.append(
+            {
+                "id": new_id(),
+                "asset_id": asset["id"],
+                "table_schema": "dbo",
+                "table_name": "Customers",
+                "column_name": col_name,
+                "vector_type": "semantic_description",
+                "value_vector": value_vector,
+                "vector_bits": vector_bits,
+            }
+        )
+
+    db.bulk_insert_mappings(SearchIndexColumn, entries)
+    db.bulk_insert_mappings(ColumnVector, vectors)
+    db.commit()
+    return asset
+
+
+@pytest.fixture(scope="class")
+def seeded_search(class_db):
+    """Seed the searchable catalog once for the whole test class."""
+    _seed_searchable(class_db)
+    return RAGSearchService(class_db, embedding_service=_MockEmbedder())
 
 
 class TestRAGSearchService:
     """Tests for RAGSearchService."""
 
-    def _seed_searchable(self, db):
-        """Seed assets with vectors for search testing."""
-        asset = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[Customers]",
-            table_schema="dbo",
-            table_name="Customers",
-            asset_type="table",
-            source_system="test",
-            schema_metadata={
-                "columns": [
-                    {"name": "CustomerID", "data_type": "int"},
-                    {"name": "CustomerName", "data_type": "varchar"},
-                ],
-            },
-        )
-        db.add(asset)
-        db.commit()
-
-        for col_name, desc in [
-            ("CustomerID", "Unique identifier for the customer"),
-            ("CustomerName", "Full name of the customer"),
-        ]:
-            entry = SearchIndexColumn(
-                id=str(uuid4()),
-                asset_id=asset.id,
-                table_schema="dbo",
-                table_name="Customers",
-                column_name=col_name,
-                data_type="varchar",
-                ordinal_position=1,
-                description=desc,
-            )
-            db.add(entry)
-
-            vec = np.random.randn(384).astype(np.float32)
-            vec = vec / np.linalg.norm(vec)
-
-            cv = ColumnVector(
-                id=str(uuid4()),
-                asset_id=asset.id,
-                table_schema="dbo",
-                table_name="Customers",
-                column_name=col_name,
-                vector_type="semantic_description",
-                value_vector=vec.tolist(),
-                vector_bits="".join("1" if v > 0 else "0" for v in vec),
-            )
-            db.add(cv)
-
-        db.commit()
-        return asset
-
-    def test_search_returns_results(self, db):
-        self._seed_searchable(db)
-        service = RAGSearchService(db, embedding_service=_MockEmbedder())
-        results = service.search("customer name", top_k=5)
+    def test_search_returns_results(self, seeded_search):
+        results = seeded_search.search("customer name", top_k=5)
 
         assert len(results) > 0
         assert "qualified_name" in results[0]
 
+    def test_search_respects_top_k(self, seeded_search):
+        results = seeded_search.search("customer", top_k=1)
+
+        assert len(results) <= 1
+
+
+class TestRAGSearchServiceEmpty:
+    """Tests for RAGSearchService on an empty catalog."""
+
     def test_search_empty_catalog(self, db):
         service = RAGSearchService(db, embedding_service=_MockEmbedder())
         results = service.search("anything", top_k=5)
 
         assert len(results) == 0
-
-    def test_search_respects_top_k(self, db):
-        self._seed_searchable(db)
-        service = RAGSearchService(db, embedding_service=_MockEmbedder())
-        results = service.search("customer", top_k=1)
-
-        assert len(results) <= 1
@@ -4,33 +4,20 @@
 
 from __future__ import annotations
 
-from uuid import uuid4
-
 from data_catalog.db.models import Asset, Relationship
 from data_catalog.db.repositories import (
     AssetRepository,
     RelationshipRepository,
 )
+from tests._factory import asset_row, relationship_row
 
 
 class TestAssetRepository:
     """Tests for AssetRepository."""
 
-    def _make_asset(self, schema="dbo", name="Test", **kwargs):
-        return Asset(
-            id=str(uuid4()),
-            qualified_name=f"[{schema}].[{name}]",
-            table_schema=schema,
-            table_name=name,
-            asset_type=kwargs.get("asset_type", "table"),
-            source_system="test",
-            schema_metadata=kwargs.get("schema_metadata"),
-            statistics=kwargs.get("statistics"),
-        )
-
     def test_find_by_qualified_name(self, db):
         repo = AssetRepository(db)
-        asset = self._make_asset()
+        asset = Asset(**asset_row())
         db.add(asset)
         db.commit()
 
@@ -46,9 +33,9 @@ class TestAssetRepository:
         repo = AssetRepository(db)
         db.add_all(
             [
-                self._make_asset("dbo", "A"),
-                self._make_asset("dbo", "B"),
-                self._make_asset("staging", "C"),
+                Asset(**asset_row("dbo", "A")),
+                Asset(**asset_row("dbo", "B")),
+                Asset(**asset_row("staging", "C")),
             ]
         )
         db.commit()
@@ -60,8 +47,8 @@ class TestAssetRepository:
         repo = AssetRepository(db)
         db.add_all(
             [
-                self._make_asset("dbo", "X"),
-                self._make_asset("dbo", "Y"),
+                Asset(**asset_row("dbo", "X")),
+                Asset(**asset_row("dbo", "Y")),
             ]
         )
         db.commit()
@@ -72,7 +59,7 @@ class TestAssetRepository:
     def test_find_all_with_limit(self, db):
         repo = AssetRepository(db)
         for i in range(5):
-            db.add(self._make_asset("dbo", f"T{i}"))
+            db.add(Asset(**asset_row("dbo", f"T{i}")))
         db.commit()
 
         results = repo.find_all(limit=3)
@@ -80,7 +67,7 @@ class TestAssetRepository:
 
     def test_find_by_id(self, db):
         repo = AssetRepository(db)
-        asset = self._make_asset()
+        asset = Asset(**asset_row())
         db.add(asset)
         db.commit()
 
@@ -95,32 +82,12 @@ class TestRelationshipRepository:
     def test_find_by_asset(self, db):
         repo = RelationshipRepository(db)
 
-        a1 = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[A]",
-            table_schema="dbo",
-            table_name="A",
-            asset_type="table",
-            source_system="test",
-        )
-        a2 = Asset(
-            id=str(uuid4()),
-            qualified_name="[dbo].[B]",
-            table_schema="dbo",
-            table_name="B",
-            asset_type="table",
-            source_system="test",
-        )
+        a1 = Asset(**asset_row("dbo", "A"))
+        a2 = Asset(**asset_row("dbo", "B"))
         db.add_all([a1, a2])
-        db.commit()
+        db.flush()
 
-        rel = Relationship(
-            id=str(uuid4()),
-            parent_asset_id=a1.id,
-            referenced_asset_id=a2.id,
-            relationship_type="foreign_key",
-            column_mappings=[{"parent": "BID", "referenced": "ID"}],
-        )
+        rel = Relationship(**relationship_row(a1.id, a2.id, column_mappings=[{"parent": "BID", "referenced": "ID"}]))
         db.add(rel)
         db.commit()
 
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2025 stharrold
+# SPDX-License-Identifier: Apache-2.0
+"""Shared fixtures for the unit test suite.
+
+Also puts the top-level scripts directory and the workflow-utilities
+scripts directory on ``sys.path`` once, before any unit test module is
+imported, so modules such as test_secrets.py and test_safe_output.py can
+import those scripts directly.
+"""
+
+import sys
+from pathlib import Path, PurePosixPath
+from types import MappingProxyType
+
+import duckdb
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+WORKFLOW_UTILS_DIR = REPO_ROOT / ".claude" / "skills" / "workflow-utilities" / "scripts"
+
+for _path in (SCRIPTS_DIR, WORKFLOW_UTILS_DIR):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+
+@pytest.fixture(scope="session")
+def duckdb_conn():
+    """One in-memory DuckDB connection shared by the whole test session.
+
+    Tests that create objects should do so on ``duckdb_conn.cursor()`` with
+    TEMP tables, which are private to that cursor's connection.
+    """
+    conn = duckdb.connect(":memory:")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def empty_repo_dir(tmp_path_factory):
+    """An empty directory standing in for a repo root with no secrets.toml.
+
+    Session-scoped; tests must not write into it.
+    """
+    return tmp_path_factory.mktemp("empty_repo")
+
+
+@pytest.fixture(scope="session")
+def secret_config_factory():
+    """Return ``make(*required, service="svc")`` building a read-only secrets config.
+
+    The config has the shape load_secrets_config() returns. It is a
+    MappingProxyType over tuples, so one test cannot leak changes into another.
+    """
+
+    def make(*required: str, service: str = "svc") -> MappingProxyType:
+        return MappingProxyType({"required": required, "optional": (), "service": service})
+
+    return make
+
+
+@pytest.fixture()
+def fake_existing_paths(monkeypatch):
+    """Return ``install(*paths)``, making is_container() see only ``paths`` exist.
+
+    Patches the ``Path`` name bound in scripts.environment_utils rather than
+    ``pathlib.Path.exists``, so path checks elsewhere (pytest's included)
+    are left alone.
+    """
+    from scripts import environment_utils
+
+    def install(*existing: str) -> None:
+        class FakePath(PurePosixPath):
+            def exists(self) -> bool:
+                return str(self) in existing
+
+        monkeypatch.setattr(environment_utils, "Path", FakePath)
+
+    return install
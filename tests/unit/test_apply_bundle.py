@@ -2,35 +2,40 @@
 # SPDX-License-Identifier: Apache-2.0
 """Tests for scripts/apply_bundle.py and release_lib.bundles."""
 
+import itertools
+import os
 import subprocess
 import sys
 import textwrap
+from collections import defaultdict
 from pathlib import Path
 
-REPO_ROOT = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(REPO_ROOT / "scripts"))
+import pytest
+
+# pytest imports test modules by absolute path, so no resolve() is needed.
+REPO_ROOT = Path(__file__).parents[2]
+# tests/unit/conftest.py puts scripts/ on sys.path.
 sys.path.insert(0, str(REPO_ROOT))
-from apply_bundle import BUNDLE_DEFINITIONS, resolve_bundles
+from apply_bundle import BUNDLE_DEFINITIONS, build_parser, resolve_bundles
 
 from release_lib.bundles import _insert_deps_into_array, copy_tree, merge_gitignore, merge_pyproject_deps
 
+# Snapshot of the bundle definitions, shared by the tests that walk them all.
+_BUNDLES = tuple(BUNDLE_DEFINITIONS.items())
 
-def test_apply_bundle_help_exits_zero():
-    result = subprocess.run(
-        [sys.executable, str(REPO_ROOT / "scripts" / "apply_bundle.py"), "--help"],
-        capture_output=True,
-        text=True,
-        cwd=REPO_ROOT,
-    )
-    assert result.returncode == 0
-    assert "bundle" in result.stdout.lower()
+
+def test_apply_bundle_help_exits_zero(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        build_parser().parse_args(["--help"])
+    assert exc_info.value.code == 0
+    assert "bundle" in capsys.readouterr().out.lower()
 
 
 def test_bundle_definitions_have_required_keys():
     """Every bundle has at least: skills, commands, copy_files, merge_pyproject_deps.
     The 'full' bundle also has 'includes'."""
     required_keys = {"skills", "commands", "copy_files", "merge_pyproject_deps"}
-    for name, defn in BUNDLE_DEFINITIONS.items():
+    for name, defn in _BUNDLES:
         for key in required_keys:
             assert key in defn, f"Bundle {name!r} missing required key {key!r}"
             assert isinstance(defn[key], list), f"Bundle {name!r} key {key!r} should be a list"
@@ -53,47 +58,44 @@ def test_full_bundle_includes_all_others():
 
 
 def test_all_referenced_paths_exist():
-    """Every path referenced in bundle definitions actually exists in the source repo."""
-    for name, defn in BUNDLE_DEFINITIONS.items():
-        # Skills -> .claude/skills/{skill}/
-        for skill in defn.get("skills", []):
-            skill_dir = REPO_ROOT / ".claude" / "skills" / skill
-            assert skill_dir.exists(), f"Bundle {name!r}: skill dir {skill_dir} does not exist"
-
-        # Commands
-        for cmd in defn.get("commands", []):
-            cmd_path = REPO_ROOT / cmd
-            assert cmd_path.exists(), f"Bundle {name!r}: command path {cmd_path} does not exist"
-
-        # Copy files
-        for f in defn.get("copy_files", []):
-            file_path = REPO_ROOT / f
-            assert file_path.exists(), f"Bundle {name!r}: copy_file {file_path} does not exist"
-
+    """Every path referenced in bundle definitions actually exists in the source repo.
+
+    Paths are grouped by parent directory and each parent is listed once with
+    os.scandir, instead of one stat() per referenced path.
+    """
+    # parent dir -> [(bundle, kind, path)]
+    paths_by_parent: dict[Path, list[tuple[str, str, Path]]] = defaultdict(list)
+    for name, defn in _BUNDLES:
+        refs = [("skill dir", Path(".claude") / "skills" / skill) for skill in defn.get("skills", [])]
+        refs += [("command path", Path(cmd)) for cmd in defn.get("commands", [])]
+        refs += [("copy_file", Path(f)) for f in defn.get("copy_files", [])]
         # Skip on update (entry is either a str path or a (src, dst) tuple)
-        for f in defn.get("skip_on_update", []):
-            src_rel = f[0] if isinstance(f, tuple) else f
-            file_path = REPO_ROOT / src_rel
-            assert file_path.exists(), f"Bundle {name!r}: skip_on_update {file_path} does not exist"
-
-        # Copy dirs
-        for d in defn.get("copy_dirs", []):
-            dir_path = REPO_ROOT / d
-            assert dir_path.exists(), f"Bundle {name!r}: copy_dir {dir_path} does not exist"
+        refs += [("skip_on_update", Path(f[0] if isinstance(f, tuple) else f)) for f in defn.get("skip_on_update", [])]
+        refs += [("copy_dir", Path(d)) for d in defn.get("copy_dirs", [])]
+        for kind, rel in refs:
+            path = REPO_ROOT / rel
+            paths_by_parent[path.parent].append((name, kind, path))
+
+    for parent, refs in paths_by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+        for name, kind, path in refs:
+            assert path.name in present, f"Bundle {name!r}: {kind} {path} does not exist"
 
 
 def test_no_overlapping_skills_between_non_full_bundles():
     """The 'secrets' and 'ci' bundles have empty skills lists.
     No skill appears in more than one non-'full' bundle."""
-    non_full = {k: v for k, v in BUNDLE_DEFINITIONS.items() if k != "full"}
     assert BUNDLE_DEFINITIONS["secrets"]["skills"] == []
     assert BUNDLE_DEFINITIONS["ci"]["skills"] == []
 
-    seen_skills: dict[str, str] = {}
-    for name, defn in non_full.items():
-        for skill in defn.get("skills", []):
-            assert skill not in seen_skills, f"Skill {skill!r} appears in both {seen_skills[skill]!r} and {name!r}"
-            seen_skills[skill] = name
+    skills = {name: frozenset(defn.get("skills", [])) for name, defn in _BUNDLES if name != "full"}
+    for a, b in itertools.combinations(skills, 2):
+        overlap = skills[a] & skills[b]
+        assert not overlap, f"Skills {sorted(overlap)!r} appear in both {a!r} and {b!r}"
 
 
 def test_dry_run_makes_no_changes(tmp_path):
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2025 stharrold
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for utils/bench_log.py - JSONL bench logger."""
+
+import json
+
+import numpy as np
+import pytest
+
+from utils.bench_log import BenchLogger
+
+
+@pytest.fixture()
+def bench_logger(tmp_path):
+    """BenchLogger writing to a temp directory, closed at teardown."""
+    with BenchLogger(model_name="test:1", run_id="run", output_dir=str(tmp_path)) as bench:
+        yield bench
+
+
+def _records(bench):
+    bench.flush()
+    with open(bench.path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestLogDocument:
+    """Tests for BenchLogger.log_document()."""
+
+    def test_entity_names_lc_lowercased_and_deduplicated(self, bench_logger):
+        """Should store sorted, unique, lowercased entity names."""
+        result = {"ok": True, "entities": [{"name": "Bob"}, {"name": "alice"}, {"name": "BOB"}]}
+        bench_logger.log_document("d1", "Title", result, {"03_decompose": 1.5})
+
+        record = _records(bench_logger)[-1]
+        assert record["entity_names"] == ["Bob", "alice", "BOB"]
+        assert record["entity_names_lc"] == ["alice", "bob"]
+
+    def test_entity_without_name_is_skipped(self, bench_logger):
+        """Missing or null entity names should not raise or reach entity_names_lc."""
+        result = {"ok": True, "entities": [{"name": None}, {"type": "Person"}, {"name": ""}, {"name": "Carol"}]}
+        bench_logger.log_document("d1", "Title", result, {})
+
+        record = _records(bench_logger)[-1]
+        assert record["entity_count"] == 4
+        assert record["entity_names_lc"] == ["carol"]
+
+    def test_non_json_values_do_not_raise(self, bench_logger):
+        """numpy scalars are stored as numbers; other stray values fall back to str()."""
+        result = {"ok": True, "entities": [{"name": b"Bob"}]}
+        timings = {"03_decompose": np.float32(1.5), "04_vectorize": None}
+        bench_logger.log_document("d1", "Title", result, timings, chunks_attempted=np.int64(2), chunk_sizes_used=[np.int64(512)])
+
+        record = _records(bench_logger)[-1]
+        assert record["chunks_attempted"] == 2
+        assert record["chunk_sizes_used"] == [512]
+        assert record["timings"] == {"03_decompose": 1.5, "04_vectorize": None}
+        assert record["entity_names"] == ["b'Bob'"]
+        assert bench_logger.log_summary()["avg_decompose_time"] == 1.5
@@ -32,41 +32,31 @@ class TestDuckDBRequired:
 
         assert current_version >= min_version, f"DuckDB version {duckdb.__version__} < minimum required 1.4.2"
 
-    def test_duckdb_in_memory_connection(self):
+    def test_duckdb_in_memory_connection(self, duckdb_conn):
         """Test: DuckDB can create in-memory database."""
-        import duckdb
-
-        conn = duckdb.connect(":memory:")
-        assert conn is not None
-        conn.close()
+        databases = duckdb_conn.execute("PRAGMA database_list").fetchall()
+        assert "memory" in {name for _, name, _ in databases}
 
-    def test_duckdb_basic_query(self):
+    def test_duckdb_basic_query(self, duckdb_conn):
         """Test: DuckDB can execute basic SQL."""
-        import duckdb
-
-        conn = duckdb.connect(":memory:")
-        result = conn.execute("SELECT 1 AS value").fetchone()
+        result = duckdb_conn.execute("SELECT 1 AS value").fetchone()
         assert result == (1,)
-        conn.close()
 
-    def test_duckdb_table_creation(self):
+    def test_duckdb_table_creation(self, duckdb_conn):
         """Test: DuckDB can create and query tables (AgentDB pattern)."""
-        import duckdb
-
-        conn = duckdb.connect(":memory:")
-
-        # Create table similar to AgentDB schema
-        conn.execute("""
-            CREATE TABLE test_sync (
-                sync_id VARCHAR PRIMARY KEY,
-                pattern VARCHAR NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Insert and query
-        conn.execute("INSERT INTO test_sync (sync_id, pattern) VALUES ('test-1', 'phase_1_specify')")
-        result = conn.execute("SELECT pattern FROM test_sync WHERE sync_id = 'test-1'").fetchone()
-        assert result == ("phase_1_specify",)
-
-        conn.close()
+        # A cursor plus a TEMP table keeps this table private to the test
+        # even though the underlying database is shared.
+        with duckdb_conn.cursor() as cur:
+            # Create table similar to AgentDB schema
+            cur.execute("""
+                CREATE TEMP TABLE test_sync (
+                    sync_id VARCHAR PRIMARY KEY,
+                    pattern VARCHAR NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # Insert and query with bound parameters, as AgentDB code should
+            cur.execute("INSERT INTO test_sync (sync_id, pattern) VALUES (?, ?)", ("test-1", "phase_1_specify"))
+            result = cur.execute("SELECT pattern FROM test_sync WHERE sync_id = ?", ("test-1",)).fetchone()
+            assert result == ("phase_1_specify",)
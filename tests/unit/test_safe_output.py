@@ -6,13 +6,9 @@
 Issue: #102 - Verify all output is ASCII-only for maximum compatibility.
 """
 
-import sys
-
 import pytest
 
-# Add workflow-utilities/scripts to path
-sys.path.insert(0, ".claude/skills/workflow-utilities/scripts")
-
+# tests/unit/conftest.py puts workflow-utilities/scripts on sys.path.
 from safe_output import (
     SYMBOLS,
     format_arrow,
@@ -12,83 +12,44 @@ Tests cover:
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
-from scripts.secrets_run import get_secret_to_stdout, main
-
+import pytest
 
-class TestGetToStdoutFromEnv:
-    """Secret found in environment -> stdout, exit 0."""
+from scripts.secrets_run import get_secret_to_stdout, main
 
-    def test_get_to_stdout_from_env(self, capsys):
-        config = {"required": ["API_KEY"], "optional": [], "service": "test-svc"}
-        with (
-            patch("scripts.secrets_run.load_secrets_config", return_value=config),
-            patch("scripts.secrets_run.is_ci", return_value=False),
-            patch("scripts.secrets_run.is_container", return_value=False),
-            patch("scripts.secrets_run.resolve_secret", return_value=("s3cr3t", "environment")),
-        ):
-            result = get_secret_to_stdout("API_KEY", Path("/fake"))
 
-        assert result == 0
-        captured = capsys.readouterr()
-        assert captured.out == "s3cr3t"
+def _stub_lookup(monkeypatch, config, resolved: tuple[str | None, str]) -> None:
+    """Stub secrets_run for a local lookup of ``config`` that resolves to ``resolved``."""
+    monkeypatch.setattr("scripts.secrets_run.load_secrets_config", lambda *args: config)
+    monkeypatch.setattr("scripts.secrets_run.is_ci", lambda: False)
+    monkeypatch.setattr("scripts.secrets_run.is_container", lambda: False)
+    monkeypatch.setattr("scripts.secrets_run.resolve_secret", lambda *args: resolved)
 
 
-class TestGetToStdoutFromKeyring:
-    """Secret found in keyring -> stdout, exit 0."""
+class TestGetToStdoutFound:
+    """Secret found (env or keyring) -> value alone on stdout, exit 0."""
 
-    def test_get_to_stdout_from_keyring(self, capsys):
-        config = {"required": ["DB_PASS"], "optional": [], "service": "my-svc"}
-        with (
-            patch("scripts.secrets_run.load_secrets_config", return_value=config),
-            patch("scripts.secrets_run.is_ci", return_value=False),
-            patch("scripts.secrets_run.is_container", return_value=False),
-            patch("scripts.secrets_run.resolve_secret", return_value=("keyring-val", "keyring")),
-        ):
-            result = get_secret_to_stdout("DB_PASS", Path("/fake"))
+    @pytest.mark.parametrize(
+        ("name", "service", "value", "source"),
+        [
+            ("API_KEY", "test-svc", "s3cr3t", "environment"),
+            ("DB_PASS", "my-svc", "keyring-val", "keyring"),
+            ("TOKEN", "svc", "abc123", "environment"),
+        ],
+    )
+    def test_get_to_stdout(self, capsys, monkeypatch, secret_config_factory, name, service, value, source):
+        config = secret_config_factory(name, service=service)
+        _stub_lookup(monkeypatch, config, (value, source))
+        result = get_secret_to_stdout(name, Path("/fake"))
 
         assert result == 0
         captured = capsys.readouterr()
-        assert captured.out == "keyring-val"
-
-
-class TestGetToStdoutNoTrailingNewline:
-    """Output must have no trailing newline for pipe-friendly usage."""
-
-    def test_no_trailing_newline(self, capsys):
-        config = {"required": ["TOKEN"], "optional": [], "service": "svc"}
-        with (
-            patch("scripts.secrets_run.load_secrets_config", return_value=config),
-            patch("scripts.secrets_run.is_ci", return_value=False),
-            patch("scripts.secrets_run.is_container", return_value=False),
-            patch("scripts.secrets_run.resolve_secret", return_value=("abc123", "environment")),
-        ):
-            get_secret_to_stdout("TOKEN", Path("/fake"))
-
-        captured = capsys.readouterr()
-        assert not captured.out.endswith("\n")
-        assert captured.out == "abc123"
-
-
-class TestGetToStdoutDiagnosticsToStderr:
-    """[INFO]/[OK]/[FAIL] go to stderr, not stdout."""
-
-    def test_diagnostics_to_stderr(self, capsys):
-        config = {"required": ["SECRET"], "optional": [], "service": "svc"}
-        with (
-            patch("scripts.secrets_run.load_secrets_config", return_value=config),
-            patch("scripts.secrets_run.is_ci", return_value=False),
-            patch("scripts.secrets_run.is_container", return_value=False),
-            patch("scripts.secrets_run.resolve_secret", return_value=("val", "environment")),
-        ):
-            get_secret_to_stdout("SECRET", Path("/fake"))
-
-        captured = capsys.readouterr()
-        # stdout has only the secret value
-        assert captured.out == "val"
-        # stderr has diagnostics
+        # stdout has only the secret value, with no trailing newline (pipe-friendly)
+        assert captured.out == value
+        # [INFO]/[OK] diagnostics go to stderr
         assert "[INFO]" in captured.err
         assert "[OK]" in captured.err
 
@@ -96,15 +57,10 @@ class TestGetToStdoutDiagnosticsToStderr:
 class TestGetToStdoutMissingSecret:
     """Secret not found -> exit 1, stderr message."""
 
-    def test_missing_secret(self, capsys):
-        config = {"required": ["MISS"], "optional": [], "service": "svc"}
-        with (
-            patch("scripts.secrets_run.load_secrets_config", return_value=config),
-            patch("scripts.secrets_run.is_ci", return_value=False),
-            patch("scripts.secrets_run.is_container", return_value=False),
-            patch("scripts.secrets_run.resolve_secret", return_value=(None, "not found")),
-        ):
-            result = get_secret_to_stdout("MISS", Path("/fake"))
+    def test_missing_secret(self, capsys, monkeypatch, secret_config_factory):
+        config = secret_config_factory("MISS")
+        _stub_lookup(monkeypatch, config, (None, "not found"))
+        result = get_secret_to_stdout("MISS", Path("/fake"))
 
         assert result == 1
         captured = capsys.readouterr()
@@ -115,10 +71,10 @@ class TestGetToStdoutMissingSecret:
 class TestGetToStdoutNotInConfig:
     """Secret name not in secrets.toml -> exit 1."""
 
-    def test_not_in_config(self, capsys):
-        config = {"required": ["OTHER"], "optional": [], "service": "svc"}
-        with patch("scripts.secrets_run.load_secrets_config", return_value=config):
-            result = get_secret_to_stdout("UNKNOWN", Path("/fake"))
+    def test_not_in_config(self, capsys, monkeypatch, secret_config_factory):
+        config = secret_config_factory("OTHER")
+        monkeypatch.setattr("scripts.secrets_run.load_secrets_config", lambda *args: config)
+        result = get_secret_to_stdout("UNKNOWN", Path("/fake"))
 
         assert result == 1
         captured = capsys.readouterr()
@@ -129,12 +85,10 @@ class TestGetToStdoutNotInConfig:
 class TestGetToStdoutMutualExclusivity:
     """--get-to-stdout with extra args -> exit 1."""
 
-    def test_mutual_exclusivity(self, capsys):
-        with (
-            patch("sys.argv", ["secrets_run.py", "--get-to-stdout", "KEY", "extra-cmd"]),
-            patch("scripts.secrets_run.get_repo_root", return_value=Path("/fake")),
-        ):
-            result = main()
+    def test_mutual_exclusivity(self, capsys, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["secrets_run.py", "--get-to-stdout", "KEY", "extra-cmd"])
+        monkeypatch.setattr("scripts.secrets_run.get_repo_root", lambda *args: Path("/fake"))
+        result = main()
 
         assert result == 1
         captured = capsys.readouterr()
@@ -144,9 +98,9 @@ class TestGetToStdoutMutualExclusivity:
 class TestGetToStdoutMissingName:
     """--get-to-stdout with no name -> exit 1."""
 
-    def test_missing_name(self, capsys):
-        with patch("sys.argv", ["secrets_run.py", "--get-to-stdout"]):
-            result = main()
+    def test_missing_name(self, capsys, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["secrets_run.py", "--get-to-stdout"])
+        result = main()
 
         assert result == 1
         captured = capsys.readouterr()
@@ -156,17 +110,13 @@ class TestGetToStdoutMissingName:
 class TestGetToStdoutMissingSecretsToml:
     """No secrets.toml -> exit 1, stderr."""
 
-    def test_missing_secrets_toml(self, capsys, tmp_path):
-        # tmp_path has no secrets.toml
-        with (
-            patch("sys.argv", ["secrets_run.py", "--get-to-stdout", "KEY"]),
-            patch("scripts.secrets_run.get_repo_root", return_value=tmp_path),
-        ):
-            # load_secrets_config calls sys.exit(1) when file missing
-            try:
-                main()
-            except SystemExit as e:
-                assert e.code == 1
+    def test_missing_secrets_toml(self, capsys, monkeypatch, empty_repo_dir):
+        monkeypatch.setattr(sys, "argv", ["secrets_run.py", "--get-to-stdout", "KEY"])
+        monkeypatch.setattr("scripts.secrets_run.get_repo_root", lambda *args: empty_repo_dir)
+        # load_secrets_config calls sys.exit(1) when file missing
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 1
 
         captured = capsys.readouterr()
         assert "secrets.toml not found" in captured.err
@@ -175,15 +125,13 @@ class TestGetToStdoutMissingSecretsToml:
 class TestCommandModeStillWorks:
     """Existing command mode is unaffected by --get-to-stdout additions."""
 
-    def test_command_mode_runs_subprocess(self, capsys):
-        config = {"required": [], "optional": [], "service": "svc"}
-        with (
-            patch("sys.argv", ["secrets_run.py", "echo", "hello"]),
-            patch("scripts.secrets_run.get_repo_root", return_value=Path("/fake")),
-            patch("scripts.secrets_run.load_secrets_config", return_value=config),
-            patch("scripts.secrets_run.inject_secrets", return_value=([], [])),
-            patch("subprocess.run") as mock_run,
-        ):
+    def test_command_mode_runs_subprocess(self, capsys, monkeypatch, secret_config_factory):
+        config = secret_config_factory()
+        monkeypatch.setattr(sys, "argv", ["secrets_run.py", "echo", "hello"])
+        monkeypatch.setattr("scripts.secrets_run.get_repo_root", lambda *args: Path("/fake"))
+        monkeypatch.setattr("scripts.secrets_run.load_secrets_config", lambda *args: config)
+        monkeypatch.setattr("scripts.secrets_run.inject_secrets", lambda *args: ([], []))
+        with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
             result = main()
 
@@ -6,20 +6,45 @@ Usage:
     uv run python -m utils.bench_compare bench_logs/A.jsonl bench_logs/B.jsonl
 """
 
+import functools
 import json
+import os
 import sys
 
+import numpy as np
+
+# Document fields compare() reads; the rest of each record is dropped on load.
+# entity_names_lc (lowercased names, written by BenchLogger; derived from
+# entity_names for older logs) is kept as a frozenset, and timings is
+# replaced by decompose_time, its 03_decompose entry (None when absent).
+DOCUMENT_FIELDS = ("document_id", "ok", "title")
+
 
 def load_bench(path):
-    """Load a bench log JSONL file. Returns (header, documents, summary)."""
+    """Load a bench log JSONL file. Returns (header, documents_by_id, summary).
+
+    documents_by_id maps document_id to its record (the last one wins if an
+    ID repeats), built in the same pass that parses the file. Documents keep
+    only DOCUMENT_FIELDS plus ``entity_names_lc`` and ``decompose_time``,
+    which bounds memory on large logs. Results are cached per path, mtime
+    and size, so loading an unchanged log again (e.g. the same file on both
+    sides of compare()) skips the parse; callers must not mutate them.
+    """
+    st = os.stat(path)
+    return _load_bench_cached(os.fspath(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_bench_cached(path, mtime_ns, size):
     header = None
-    documents = []
+    documents_by_id = {}
     summary = None
 
-    with open(path, encoding="utf-8") as f:
+    # Binary mode: json.loads takes the UTF-8 bytes directly and tolerates
+    # the trailing newline, so lines need no decode or strip.
+    with open(path, "rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
             record = json.loads(line)
             rtype = record.get("type")
@@ -28,15 +53,27 @@ def load_bench(path):
             elif rtype == "summary":
                 summary = record
             elif rtype == "document":
-                documents.append(record)
+                document = {k: record[k] for k in DOCUMENT_FIELDS if k in record}
+                names_lc = record.get("entity_names_lc")
+                if names_lc is None:
+                    names_lc = (n.lower() for n in record.get("entity_names", ()))
+                document["entity_names_lc"] = frozenset(names_lc)
+                document["decompose_time"] = (record.get("timings") or {}).get("03_decompose")
+                documents_by_id[record["document_id"]] = document
+
+    return header, documents_by_id, summary
+
 
-    return header, documents, summary
+def _decompose_times(docs_by_id, document_ids):
+    """Return the decompose times of ``document_ids`` that have one, as a float array."""
+    times = (docs_by_id[did]["decompose_time"] for did in document_ids)
+    return np.fromiter((t for t in times if t is not None), dtype=np.float64)
 
 
 def compare(path_a, path_b):
     """Print side-by-side comparison of two bench logs."""
-    header_a, docs_a, summary_a = load_bench(path_a)
-    header_b, docs_b, summary_b = load_bench(path_b)
+    header_a, map_a, summary_a = load_bench(path_a)
+    header_b, map_b, summary_b = load_bench(path_b)
 
     model_a = (header_a or {}).get("model", "A")
     model_b = (header_b or {}).get("model", "B")
@@ -77,9 +114,7 @@ def compare(path_a, path_b):
                 print(f"  {t:<28} {types_a.get(t, 0):>18} {types_b.get(t, 0):>18}")
 
     # --- Per-document overlap ---
-    map_a = {e["document_id"]: e for e in docs_a}
-    map_b = {e["document_id"]: e for e in docs_b}
-    common_ids = set(map_a.keys()) & set(map_b.keys())
+    common_ids = map_a.keys() & map_b.keys()
 
     if common_ids:
         print(f"\n--- Per-document comparison ({len(common_ids)} common documents) ---")
@@ -114,8 +149,8 @@ def compare(path_a, path_b):
         if both_ok:
             overlap_counts = []
             for did in both_ok:
-                names_a = set(n.lower() for n in map_a[did].get("entity_names", []))
-                names_b = set(n.lower() for n in map_b[did].get("entity_names", []))
+                names_a = map_a[did]["entity_names_lc"]
+                names_b = map_b[did]["entity_names_lc"]
                 if names_a or names_b:
                     overlap = len(names_a & names_b) / max(len(names_a | names_b), 1)
                     overlap_counts.append(overlap)
@@ -125,12 +160,12 @@ def compare(path_a, path_b):
                 print(f"\nEntity name overlap (Jaccard): {avg_overlap:.1%} avg across {len(overlap_counts)} documents")
 
         # Timing comparison
-        decompose_a = [map_a[did]["timings"].get("03_decompose", 0) for did in both_ok if "03_decompose" in map_a[did].get("timings", {})]
-        decompose_b = [map_b[did]["timings"].get("03_decompose", 0) for did in both_ok if "03_decompose" in map_b[did].get("timings", {})]
-        if decompose_a and decompose_b:
+        decompose_a = _decompose_times(map_a, both_ok)
+        decompose_b = _decompose_times(map_b, both_ok)
+        if decompose_a.size and decompose_b.size:
             print("\nDecompose time (common documents):")
-            print(f"  {model_a}: avg {sum(decompose_a) / len(decompose_a):.1f}s, min {min(decompose_a):.1f}s, max {max(decompose_a):.1f}s")
-            print(f"  {model_b}: avg {sum(decompose_b) / len(decompose_b):.1f}s, min {min(decompose_b):.1f}s, max {max(decompose_b):.1f}s")
+            print(f"  {model_a}: avg {decompose_a.mean():.1f}s, min {decompose_a.min():.1f}s, max {decompose_a.max():.1f}s")
+            print(f"  {model_b}: avg {decompose_b.mean():.1f}s, min {decompose_b.min():.1f}s, max {decompose_b.max():.1f}s")
     else:
         print("\nNo common document IDs found between the two runs.")
 
@@ -4,14 +4,24 @@
 
 import json
 import logging
+import numbers
 import os
 import time
-from collections import Counter
+from collections import defaultdict
 from datetime import UTC, datetime
 
 logger = logging.getLogger(__name__)
 
 
+def _native(value):
+    """Return numeric scalars (including numpy's) as plain int/float; leave anything else as is."""
+    if isinstance(value, numbers.Integral) and not isinstance(value, bool):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        return float(value)
+    return value
+
+
 class BenchLogger:
     """Append-only JSONL logger capturing per-document extraction metrics."""
 
@@ -22,7 +32,17 @@ class BenchLogger:
         os.makedirs(output_dir, exist_ok=True)
 
         self.path = os.path.join(output_dir, f"{self.run_id}.jsonl")
-        self._results = []
+        # One block-buffered handle for the whole run; the header and
+        # summary are flushed explicitly, document records as the buffer fills.
+        self._fh = open(self.path, "a", encoding="utf-8")
+        # Running aggregates for log_summary(), updated by log_document();
+        # all but the document count cover successful documents only.
+        self._total = 0
+        self._succeeded = 0
+        self._entity_sum = 0
+        self._decompose_sum = 0.0
+        self._decompose_n = 0
+        self._type_counts = defaultdict(int)
         self._start_time = time.perf_counter()
 
         # Write header line
@@ -35,66 +55,98 @@ class BenchLogger:
             "workers": workers,
         }
         self._append(header)
+        self.flush()
         logger.info("Bench log: %s", self.path)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def flush(self):
+        """Write any buffered records to the log file."""
+        if not self._fh.closed:
+            self._fh.flush()
+
+    def close(self):
+        """Flush and close the log file. Safe to call more than once."""
+        self._fh.close()
+
     def _append(self, record):
-        with open(self.path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record, default=str) + "\n")
+        # log_document() normalizes the numeric fields, so the fallback only
+        # runs for stray values (e.g. a non-string entity name), which are
+        # written as their str() rather than aborting the caller's run.
+        try:
+            line = json.dumps(record)
+        except TypeError:
+            line = json.dumps(record, default=str)
+        self._fh.write(line + "\n")
 
     def log_document(self, document_id, title, result, timings, chunks_attempted=1, chunks_succeeded=1, chunk_sizes_used=None):
         """Log one document's extraction result."""
         ok = result.get("ok", "error" not in result)
         entities = result.get("entities", [])
         summary = result.get("summary", "")
+        error = result.get("error")
+        timings = {stage: float(seconds) if isinstance(seconds, numbers.Real) else seconds for stage, seconds in (timings or {}).items()}
+        entity_names = [e.get("name", "") for e in entities]
 
-        type_counts = Counter(e.get("type", "Unknown") for e in entities)
+        type_counts = {}
+        for e in entities:
+            t = e.get("type", "Unknown")
+            type_counts[t] = type_counts.get(t, 0) + 1
 
         record = {
             "type": "document",
-            "document_id": document_id,
+            "document_id": str(document_id),
             "title": (title or "")[:80],
             "model": self.model,
             "ok": bool(ok),
             "entity_count": len(entities),
-            "entity_names": [e.get("name", "") for e in entities],
-            "entity_types": dict(type_counts),
+            "entity_names": entity_names,
+            # Lowercased and deduplicated once here so bench_compare can use
+            # it as-is for name overlap; missing or non-string names are skipped.
+            "entity_names_lc": sorted({n.lower() for n in entity_names if isinstance(n, str) and n}),
+            "entity_types": type_counts,
             "summary_length": len(summary),
-            "chunks_attempted": chunks_attempted,
-            "chunks_succeeded": chunks_succeeded,
-            "chunk_sizes_used": chunk_sizes_used or [],
+            "chunks_attempted": _native(chunks_attempted),
+            "chunks_succeeded": _native(chunks_succeeded),
+            "chunk_sizes_used": [_native(size) for size in chunk_sizes_used or []],
             "timings": timings,
-            "error": result.get("error"),
+            "error": None if error is None else str(error),
             "timestamp": datetime.now(UTC).isoformat(),
         }
-        self._results.append(record)
         self._append(record)
 
+        self._total += 1
+        if record["ok"]:
+            self._succeeded += 1
+            self._entity_sum += record["entity_count"]
+            for t, c in type_counts.items():
+                self._type_counts[t] += c
+            if isinstance(timings.get("03_decompose"), float):
+                self._decompose_sum += timings["03_decompose"]
+                self._decompose_n += 1
+
     def log_summary(self):
         """Append a final summary line with aggregate stats."""
-        ok_results = [r for r in self._results if r.get("ok")]
-        failed_results = [r for r in self._results if not r.get("ok")]
-
-        all_types = Counter()
-        for r in ok_results:
-            for t, c in r.get("entity_types", {}).items():
-                all_types[t] += c
-
-        decompose_times = [r["timings"].get("03_decompose", 0) for r in ok_results if "03_decompose" in r.get("timings", {})]
-
         summary = {
             "type": "summary",
             "run_id": self.run_id,
             "model": self.model,
-            "total_documents": len(self._results),
-            "succeeded": len(ok_results),
-            "failed": len(failed_results),
-            "avg_entities_per_doc": sum(r.get("entity_count", 0) for r in ok_results) / max(len(ok_results), 1),
-            "avg_decompose_time": sum(decompose_times) / max(len(decompose_times), 1),
+            "total_documents": self._total,
+            "succeeded": self._succeeded,
+            "failed": self._total - self._succeeded,
+            "avg_entities_per_doc": self._entity_sum / max(self._succeeded, 1),
+            "avg_decompose_time": self._decompose_sum / max(self._decompose_n, 1),
             "total_wall_time": time.perf_counter() - self._start_time,
-            "entity_type_distribution": dict(all_types),
+            "entity_type_distribution": dict(self._type_counts),
             "timestamp": datetime.now(UTC).isoformat(),
         }
         self._append(summary)
+        self.flush()
         logger.info(
             "Bench summary: %d/%d succeeded, %.1f avg entities, %.1fs avg decompose",
             summary["succeeded"],
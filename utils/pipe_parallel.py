@@ -375,103 +375,109 @@ def run(batch_size=10, workers=1, model=None, bench=False):
 
         bench_logger = BenchLogger(model_name=model, batch_size=batch_size, workers=workers)
 
-    # Phase 1: Fetch (brief DB open)
-    with CoreDB() as db:
-        docs = db.query(_fetch_query(MIDDLE_SUBSTANTIVE_THRESHOLD), [batch_size])
-        middle_docs = db.query(_middle_query(MIDDLE_SUBSTANTIVE_THRESHOLD), [batch_size])
+    # Closed in the finally block so buffered bench records reach disk even
+    # if a batch or DB call raises.
+    try:
+        # Phase 1: Fetch (brief DB open)
+        with CoreDB() as db:
+            docs = db.query(_fetch_query(MIDDLE_SUBSTANTIVE_THRESHOLD), [batch_size])
+            middle_docs = db.query(_middle_query(MIDDLE_SUBSTANTIVE_THRESHOLD), [batch_size])
 
-    if not docs and not middle_docs:
-        logger.info("No verified documents pending.")
-        return
+        if not docs and not middle_docs:
+            logger.info("No verified documents pending.")
+            return
 
-    # Phase 2: Compute (no DB)
-    middle_results = []
-    if middle_docs:
-        logger.info("Processing %d middle-of-thread documents (no LLM)...", len(middle_docs))
-        for did, subject, from_name, from_email, to_emails, cc_emails in middle_docs:
-            result = _process_middle_document(embedder, did, subject, from_name, from_email, to_emails, cc_emails)
-            middle_results.append(result)
-
-    results = []
-    wall_start = time.perf_counter()
-
-    if docs:
-        logger.info("Processing %d documents (LLM decompose, DB released)...", len(docs))
-        for did, subject, body, from_name, from_email, to_emails, cc_emails in docs:
-            result = _decompose_document(llm, embedder, did, subject, body, from_name, from_email, to_emails, cc_emails)
-            result["subject"] = (subject or "")[:50]
-            results.append(result)
-
-            # Bench logging
-            if bench_logger and result.get("ok"):
-                chunk_meta = result.get("chunk_meta", {})
-                bench_logger.log_document(
-                    document_id=did,
-                    title=subject,
-                    result=result,
-                    timings=result.get("timings", {}),
-                    chunks_attempted=chunk_meta.get("chunks_attempted", 1),
-                    chunks_succeeded=chunk_meta.get("chunks_succeeded", 1),
-                    chunk_sizes_used=chunk_meta.get("chunk_sizes_used", []),
-                )
+        # Phase 2: Compute (no DB)
+        middle_results = []
+        if middle_docs:
+            logger.info("Processing %d middle-of-thread documents (no LLM)...", len(middle_docs))
+            for did, subject, from_name, from_email, to_emails, cc_emails in middle_docs:
+                result = _process_middle_document(embedder, did, subject, from_name, from_email, to_emails, cc_emails)
+                middle_results.append(result)
+
+        results = []
+        wall_start = time.perf_counter()
+
+        if docs:
+            logger.info("Processing %d documents (LLM decompose, DB released)...", len(docs))
+            for did, subject, body, from_name, from_email, to_emails, cc_emails in docs:
+                result = _decompose_document(llm, embedder, did, subject, body, from_name, from_email, to_emails, cc_emails)
+                result["subject"] = (subject or "")[:50]
+                results.append(result)
+
+                # Bench logging
+                if bench_logger and result.get("ok"):
+                    chunk_meta = result.get("chunk_meta", {})
+                    bench_logger.log_document(
+                        document_id=did,
+                        title=subject,
+                        result=result,
+                        timings=result.get("timings", {}),
+                        chunks_attempted=chunk_meta.get("chunks_attempted", 1),
+                        chunks_succeeded=chunk_meta.get("chunks_succeeded", 1),
+                        chunk_sizes_used=chunk_meta.get("chunk_sizes_used", []),
+                    )
+
+        wall_elapsed = time.perf_counter() - wall_start
 
-    wall_elapsed = time.perf_counter() - wall_start
+        # Phase 3: Persist (brief DB open)
+        with CoreDB() as db:
+            if middle_results:
+                _persist_results(db, middle_results)
+            if results:
+                _persist_results(db, results)
+
+        # --- Report ---
+        print(f"\n{'=' * 90}")
+        print(f"PARALLEL PIPELINE RESULTS --{len(docs)} documents, wall time: {wall_elapsed:.1f}s")
+        print(f"{'=' * 90}")
+
+        print(f"\n{'#':>2}  {'OK':>3}  {'03_decomp':>10}  {'04_vector':>10}  {'05a_link':>10}  Subject")
+        print("-" * 80)
+        for i, r in enumerate(results, 1):
+            t = r.get("timings", {})
+            ok = "Y" if r.get("ok") else "N"
+            d03 = f"{t.get('03_decompose', 0):.1f}s" if "03_decompose" in t else "--"
+            d04 = f"{t.get('04_vectorize', 0):.3f}s" if "04_vectorize" in t else "--"
+            d05 = f"{t.get('05a_link_local', 0):.3f}s" if "05a_link_local" in t else "--"
+            subj = r.get("subject", "")
+            if not r.get("ok"):
+                subj = f"[ERR: {r.get('error', '?')[:40]}]"
+            print(f"{i:2}  {ok:>3}  {d03:>10}  {d04:>10}  {d05:>10}  {subj}")
+
+        ok_results = [r for r in results if r.get("ok")]
+        if ok_results:
+            stages = ["03_decompose", "04_vectorize", "05a_link_local"]
+            print(f"\n{'STAGE':<20} {'MIN':>8} {'AVG':>8} {'MAX':>8} {'TOTAL':>8}")
+            print("-" * 56)
+            for stage in stages:
+                vals = [r["timings"].get(stage, 0) for r in ok_results]
+                print(f"{stage:<20} {min(vals):>7.2f}s {sum(vals) / len(vals):>7.2f}s {max(vals):>7.2f}s {sum(vals):>7.1f}s")
+
+            total_per_doc = [sum(r["timings"].get(s, 0) for s in stages) for r in ok_results]
+            print(f"\n{'per-document total':<20} {min(total_per_doc):>7.2f}s {sum(total_per_doc) / len(total_per_doc):>7.2f}s {max(total_per_doc):>7.2f}s")
+            total_nodes = sum(r.get("nodes", 0) if isinstance(r.get("nodes"), int) else len(r.get("nodes", [])) for r in ok_results)
+            total_edges = sum(r.get("edges", 0) if isinstance(r.get("edges"), int) else len(r.get("edges", [])) for r in ok_results)
+            print(f"\nCreated {total_nodes} nodes, {total_edges} edges")
+
+        print(f"\nSuccess: {len(ok_results)}/{len(results)}")
+        failed = [r for r in results if not r.get("ok")]
+        for r in failed:
+            print(f"  FAILED: {r.get('error', '?')}")
 
-    # Phase 3: Persist (brief DB open)
-    with CoreDB() as db:
         if middle_results:
-            _persist_results(db, middle_results)
-        if results:
-            _persist_results(db, results)
-
-    # --- Report ---
-    print(f"\n{'=' * 90}")
-    print(f"PARALLEL PIPELINE RESULTS --{len(docs)} documents, wall time: {wall_elapsed:.1f}s")
-    print(f"{'=' * 90}")
-
-    print(f"\n{'#':>2}  {'OK':>3}  {'03_decomp':>10}  {'04_vector':>10}  {'05a_link':>10}  Subject")
-    print("-" * 80)
-    for i, r in enumerate(results, 1):
-        t = r.get("timings", {})
-        ok = "Y" if r.get("ok") else "N"
-        d03 = f"{t.get('03_decompose', 0):.1f}s" if "03_decompose" in t else "--"
-        d04 = f"{t.get('04_vectorize', 0):.3f}s" if "04_vectorize" in t else "--"
-        d05 = f"{t.get('05a_link_local', 0):.3f}s" if "05a_link_local" in t else "--"
-        subj = r.get("subject", "")
-        if not r.get("ok"):
-            subj = f"[ERR: {r.get('error', '?')[:40]}]"
-        print(f"{i:2}  {ok:>3}  {d03:>10}  {d04:>10}  {d05:>10}  {subj}")
-
-    ok_results = [r for r in results if r.get("ok")]
-    if ok_results:
-        stages = ["03_decompose", "04_vectorize", "05a_link_local"]
-        print(f"\n{'STAGE':<20} {'MIN':>8} {'AVG':>8} {'MAX':>8} {'TOTAL':>8}")
-        print("-" * 56)
-        for stage in stages:
-            vals = [r["timings"].get(stage, 0) for r in ok_results]
-            print(f"{stage:<20} {min(vals):>7.2f}s {sum(vals) / len(vals):>7.2f}s {max(vals):>7.2f}s {sum(vals):>7.1f}s")
-
-        total_per_doc = [sum(r["timings"].get(s, 0) for s in stages) for r in ok_results]
-        print(f"\n{'per-document total':<20} {min(total_per_doc):>7.2f}s {sum(total_per_doc) / len(total_per_doc):>7.2f}s {max(total_per_doc):>7.2f}s")
-        total_nodes = sum(r.get("nodes", 0) if isinstance(r.get("nodes"), int) else len(r.get("nodes", [])) for r in ok_results)
-        total_edges = sum(r.get("edges", 0) if isinstance(r.get("edges"), int) else len(r.get("edges", [])) for r in ok_results)
-        print(f"\nCreated {total_nodes} nodes, {total_edges} edges")
-
-    print(f"\nSuccess: {len(ok_results)}/{len(results)}")
-    failed = [r for r in results if not r.get("ok")]
-    for r in failed:
-        print(f"  FAILED: {r.get('error', '?')}")
-
-    if middle_results:
-        middle_ok = [r for r in middle_results if r.get("ok")]
-        middle_nodes = sum(len(r.get("nodes", [])) for r in middle_ok)
-        middle_edges = sum(len(r.get("edges", [])) for r in middle_ok)
-        print(f"\nMiddle documents (skipped LLM): {len(middle_ok)}/{len(middle_results)}")
-        print(f"  Created {middle_nodes} nodes, {middle_edges} edges")
-
-    if bench_logger:
-        bench_logger.log_summary()
-        print(f"\nBench log: {bench_logger.path}")
+            middle_ok = [r for r in middle_results if r.get("ok")]
+            middle_nodes = sum(len(r.get("nodes", [])) for r in middle_ok)
+            middle_edges = sum(len(r.get("edges", [])) for r in middle_ok)
+            print(f"\nMiddle documents (skipped LLM): {len(middle_ok)}/{len(middle_results)}")
+            print(f"  Created {middle_nodes} nodes, {middle_edges} edges")
+
+        if bench_logger:
+            bench_logger.log_summary()
+            print(f"\nBench log: {bench_logger.path}")
+    finally:
+        if bench_logger:
+            bench_logger.close()
 
 
 def run_batches(total_docs=0, batch_size=10, workers=1, model=None):